@@ -5,8 +5,160 @@ This module contains the FrameNetVisualizer class that provides FrameNet-specifi
 functionality for creating semantic graph visualizations.
 """
 
+from functools import lru_cache
+
+from matplotlib.patches import Patch
+
 from .Visualizer import Visualizer
 
+# Longest definitions shown in tooltips, including the trailing ellipsis
+_DEFINITION_LIMIT = 100
+_FRAME_DEFINITION_LIMIT = 80
+
+
+def _ellipsize(text, limit):
+    """Shorten text to at most limit characters, ending in "..." when cut."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _lexical_unit_info(depth, relatives, frame, pos, definition):
+    """Tooltip lines below the title of a lexical unit node."""
+    info = [f"Frame: {frame}", f"Depth: {depth}", f"POS: {pos}"]
+    
+    if definition and not definition.isspace():
+        info.append(f"Definition: {_ellipsize(definition, _DEFINITION_LIMIT)}")
+    return info
+
+
+def _frame_element_info(depth, relatives, frame, core_type, element_id, definition):
+    """Tooltip lines below the title of a frame element node."""
+    info = [
+        f"Frame: {frame}",
+        f"Depth: {depth}",
+        f"Core Type: {core_type}",
+        f"ID: {element_id}",
+    ]
+    
+    if definition and not definition.isspace():
+        info.append(f"Definition: {_ellipsize(definition, _DEFINITION_LIMIT)}")
+    return info
+
+
+def _frame_info(depth, relatives, definition):
+    """Tooltip lines below the title of a frame node."""
+    parents, children = relatives
+    info = [f"Depth: {depth}"]
+    
+    # Limit parents and children display to avoid overly long tooltips
+    if parents:
+        if len(parents) <= 3:
+            info.append(f"Parents: {', '.join(parents)}")
+        else:
+            info.append(f"Parents: {', '.join(parents[:3])} ... and {len(parents)-3} more")
+    
+    if children:
+        if len(children) <= 3:
+            info.append(f"Children: {', '.join(children)}")
+        else:
+            info.append(f"Children: {', '.join(children[:3])} ... and {len(children)-3} more")
+    
+    # Add frame definition if available
+    if definition and not definition.isspace():
+        # Truncate long definitions for tooltip readability
+        info.append(f"Definition: {_ellipsize(definition, _FRAME_DEFINITION_LIMIT)}")
+    return info
+
+
+# Tooltip layout by FrameNet node type: the title of the first line, the
+# builder of the lines below it and the frame_info fields it shows, with
+# their defaults; other node types are shown as frames
+_INFO_LAYOUTS = {
+    'lexical_unit': ("Lexical Unit", _lexical_unit_info,
+                     (('frame', 'Unknown'), ('pos', 'Unknown'), ('definition', ''))),
+    'frame_element': ("Frame Element", _frame_element_info,
+                      (('frame', 'Unknown'), ('core_type', 'Unknown'),
+                       ('id', 'Unknown'), ('definition', ''))),
+    'frame': ("Frame", _frame_info, (('definition', ''),)),
+}
+
+
+# Legend entries are built once; the legend copies their style into its
+# own handles, so the same patches can back every figure
+FRAMENET_DAG_LEGEND = (
+    Patch(facecolor='lightblue', label='Source Frames (no parents)'),
+    Patch(facecolor='lightgreen', label='Intermediate Frames'),
+    Patch(facecolor='lightcoral', label='Sink Frames (no children)'),
+    Patch(facecolor='lightgray', label='Isolated Frames'),
+    Patch(facecolor='lightyellow', label='Lexical Units'),
+    Patch(facecolor='lightpink', label='Frame Elements'),
+)
+_TAXONOMIC_LEGEND = (
+    Patch(facecolor='lightblue', label='Root Frames (Depth 0)'),
+    Patch(facecolor='lightgreen', label='Level 1 Frames'),
+    Patch(facecolor='lightyellow', label='Level 2 Frames'),
+    Patch(facecolor='lightcoral', label='Deeper Levels'),
+)
+
+
+def frame_node_info(hierarchy, node):
+    """Get the tooltip text for a FrameNet node in hierarchy."""
+    if node not in hierarchy:
+        return f"Node: {node}\nNo additional information available."
+    
+    data = hierarchy[node]
+    frame_info = data.get('frame_info', {})
+    node_type = frame_info.get('node_type', 'frame')
+    if node_type not in _INFO_LAYOUTS:
+        node_type = 'frame'
+    title, _, fields = _INFO_LAYOUTS[node_type]
+    
+    # Only the title names the node; frames are titled by their graph node
+    if node_type == 'frame':
+        title = f"{title}: {node}"
+        relatives = (tuple(data.get('parents', ())), tuple(data.get('children', ())))
+    else:
+        title = f"{title}: {frame_info.get('name', node)}"
+        relatives = ()
+    
+    # The lines below the title depend only on these fields, so every node
+    # with the same fields shares one cache entry
+    key = (node_type, data.get('depth', 'Unknown'), relatives,
+           tuple(frame_info.get(field, default) for field, default in fields))
+    try:
+        hash(key)
+    except TypeError:
+        # Field values that cannot be hashed are formatted without the cache
+        lines = _frame_info_lines.__wrapped__(*key)
+    else:
+        lines = _frame_info_lines(*key)
+    return _join_info((title,) + lines)
+
+
+@lru_cache(maxsize=2048)
+def _frame_info_lines(node_type, depth, relatives, values):
+    """Format the tooltip lines below the title, shared by every visualizer."""
+    builder = _INFO_LAYOUTS[node_type][1]
+    return tuple(builder(depth, relatives, *values))
+
+
+def _join_info(info):
+    """Join tooltip lines, keeping long tooltips within 300 characters."""
+    # Short tooltips are joined as they are, without building the text twice
+    if sum(map(len, info)) + len(info) - 1 <= 300:
+        return '\n'.join(info)
+    
+    # Otherwise keep whole lines within 280 characters, leaving room for
+    # the truncation notice
+    kept = []
+    char_count = 0
+    for line in info:
+        char_count += len(line) + 1
+        if char_count > 280:
+            kept.append("... (tooltip truncated)")
+            break
+        kept.append(line)
+    return '\n'.join(kept)
+
 
 class FrameNetVisualizer(Visualizer):
     """FrameNet-specific visualizer with specialized coloring and information display."""
@@ -28,126 +180,16 @@ class FrameNetVisualizer(Visualizer):
             return 'lightpink'    # Frame elements get pink color
         
         # For frames, use DAG-based coloring
-        in_degree = self.G.in_degree(node)
-        out_degree = self.G.out_degree(node)
-        
-        if in_degree == 0 and out_degree > 0:
-            return 'lightblue'    # Source nodes (no parents)
-        elif in_degree > 0 and out_degree == 0:
-            return 'lightcoral'   # Sink nodes (no children)
-        elif in_degree > 0 and out_degree > 0:
-            return 'lightgreen'   # Intermediate nodes
-        else:
-            return 'lightgray'    # Isolated nodes
+        return self._degree_color(node)
     
     def get_node_info(self, node):
         """Get detailed information about a FrameNet node."""
-        if node not in self.hierarchy:
-            return f"Node: {node}\nNo additional information available."
-        
-        data = self.hierarchy[node]
-        frame_info = data.get('frame_info', {})
-        node_type = frame_info.get('node_type', 'frame')
-        
-        # Different display format for different FrameNet node types
-        if node_type == 'lexical_unit':
-            info = [f"Lexical Unit: {frame_info.get('name', node)}"]
-            info.append(f"Frame: {frame_info.get('frame', 'Unknown')}")
-            info.append(f"Depth: {data.get('depth', 'Unknown')}")
-            info.append(f"POS: {frame_info.get('pos', 'Unknown')}")
-            
-            definition = frame_info.get('definition', '')
-            if definition and len(definition.strip()) > 0:
-                if len(definition) > 100:
-                    definition = definition[:97] + "..."
-                info.append(f"Definition: {definition}")
-        elif node_type == 'frame_element':
-            info = [f"Frame Element: {frame_info.get('name', node)}"]
-            info.append(f"Frame: {frame_info.get('frame', 'Unknown')}")
-            info.append(f"Depth: {data.get('depth', 'Unknown')}")
-            info.append(f"Core Type: {frame_info.get('core_type', 'Unknown')}")
-            info.append(f"ID: {frame_info.get('id', 'Unknown')}")
-            
-            definition = frame_info.get('definition', '')
-            if definition and len(definition.strip()) > 0:
-                if len(definition) > 100:
-                    definition = definition[:97] + "..."
-                info.append(f"Definition: {definition}")
-        else:
-            # Frame node
-            info = [f"Frame: {node}"]
-            info.append(f"Depth: {data.get('depth', 'Unknown')}")
-            
-            parents = data.get('parents', [])
-            if parents:
-                # Limit parents display to avoid overly long tooltips
-                if len(parents) <= 3:
-                    info.append(f"Parents: {', '.join(parents)}")
-                elif len(parents) <= 6:
-                    info.append(f"Parents: {', '.join(parents[:3])}")
-                    info.append(f"  ... and {len(parents)-3} more")
-                else:
-                    # For nodes with many parents, just show count
-                    info.append(f"Parents: {len(parents)} parent nodes")
-            
-            children = data.get('children', [])
-            if children:
-                # Limit children display to avoid overly long tooltips
-                if len(children) <= 3:
-                    info.append(f"Children: {', '.join(children)}")
-                elif len(children) <= 6:
-                    info.append(f"Children: {', '.join(children[:3])}")
-                    info.append(f"  ... and {len(children)-3} more")
-                else:
-                    # For nodes with many children, just show count
-                    info.append(f"Children: {len(children)} child nodes")
-            
-            # Add frame definition if available
-            definition = frame_info.get('definition', '')
-            if definition and len(definition.strip()) > 0:
-                # Truncate long definitions for tooltip readability
-                if len(definition) > 80:
-                    definition = definition[:77] + "..."
-                info.append(f"Definition: {definition}")
-        
-        # Join and ensure tooltip doesn't become too long overall
-        result = '\n'.join(info)
-        if len(result) > 300:
-            # If tooltip is still too long, truncate and add notice
-            lines = result.split('\n')
-            truncated_lines = []
-            char_count = 0
-            
-            for line in lines:
-                if char_count + len(line) + 1 <= 280:  # Leave room for truncation notice
-                    truncated_lines.append(line)
-                    char_count += len(line) + 1
-                else:
-                    truncated_lines.append("... (tooltip truncated)")
-                    break
-            
-            result = '\n'.join(truncated_lines)
-        
-        return result
+        return frame_node_info(self.hierarchy, node)
     
     def create_dag_legend(self):
         """Create legend elements for FrameNet DAG visualization."""
-        from matplotlib.patches import Patch
-        return [
-            Patch(facecolor='lightblue', label='Source Frames (no parents)'),
-            Patch(facecolor='lightgreen', label='Intermediate Frames'),
-            Patch(facecolor='lightcoral', label='Sink Frames (no children)'),
-            Patch(facecolor='lightgray', label='Isolated Frames'),
-            Patch(facecolor='lightyellow', label='Lexical Units'),
-            Patch(facecolor='lightpink', label='Frame Elements')
-        ]
+        return list(FRAMENET_DAG_LEGEND)
     
     def create_taxonomic_legend(self):
         """Create legend elements for FrameNet taxonomic visualization."""
-        from matplotlib.patches import Patch
-        return [
-            Patch(facecolor='lightblue', label='Root Frames (Depth 0)'),
-            Patch(facecolor='lightgreen', label='Level 1 Frames'),
-            Patch(facecolor='lightyellow', label='Level 2 Frames'),
-            Patch(facecolor='lightcoral', label='Deeper Levels')
-        ]
\ No newline at end of file
+        return list(_TAXONOMIC_LEGEND)
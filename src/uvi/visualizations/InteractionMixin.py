@@ -0,0 +1,160 @@
+"""
+Interaction Mixin.
+
+This module contains the InteractionMixin class that provides the hover
+throttling, the view-change scheduling, the hover tooltip and the blitting
+shared by the interactive visualizers.
+"""
+
+
+class InteractionMixin:
+    """Throttled hover tooltip blitted over a cached background.
+    
+    Classes using this mixin set fig, ax, annotation, _background,
+    _hover_timer, _pending_hover and _view_timer, implement
+    _process_hover(event) and _on_view_changed(), and connect on_hover(),
+    _schedule_view_update() and _on_draw() to the canvas and axes events.
+    """
+    
+    # Hover events are coalesced so that at most one is processed per interval
+    HOVER_INTERVAL_MS = 50
+    
+    # Tooltip styling shared by every hover
+    TOOLTIP_STYLE = {
+        'xytext': (20, 20),
+        'textcoords': "offset points",
+        'bbox': dict(boxstyle="round,pad=0.5", fc="wheat", alpha=0.8),
+        'arrowprops': dict(arrowstyle="->", connectionstyle="arc3,rad=0"),
+        'fontsize': 9,
+        'fontweight': 'normal',
+    }
+    
+    def _create_hover_timer(self):
+        """Create the single-shot timer that coalesces bursts of motion events."""
+        timer = self.fig.canvas.new_timer(interval=self.HOVER_INTERVAL_MS)
+        timer.single_shot = True
+        timer.add_callback(self._flush_hover)
+        return timer
+    
+    def on_hover(self, event):
+        """Handle mouse hover events."""
+        if self._hover_timer is None:
+            self._process_hover(event)
+            return
+        
+        # Keep only the latest event; the timer processes it once per interval
+        if self._pending_hover is None:
+            self._hover_timer.start()
+        self._pending_hover = event
+    
+    def _flush_hover(self):
+        """Process the most recent hover event collected since the last flush."""
+        event, self._pending_hover = self._pending_hover, None
+        if event is not None:
+            self._process_hover(event)
+    
+    def _create_view_timer(self):
+        """Create the single-shot timer that runs one pass per view change."""
+        timer = self.fig.canvas.new_timer(interval=0)
+        timer.single_shot = True
+        timer.add_callback(self._flush_view_update)
+        return timer
+    
+    def _view_update_needed(self):
+        """Check whether view changes affect anything drawn."""
+        return True
+    
+    def _schedule_view_update(self, ax=None):
+        """Queue one _on_view_changed() pass for the view limits being changed."""
+        if not self._view_update_needed():
+            return
+        if self._view_timer is None:
+            self._on_view_changed()
+            return
+        
+        # A zoom or pan sets both limits; restarting the pending timer
+        # folds the x and y updates into one pass
+        self._view_timer.start()
+    
+    def _flush_view_update(self):
+        """Run the queued view pass against the final view limits and redraw."""
+        self._on_view_changed()
+        self.fig.canvas.draw_idle()
+    
+    def _on_view_changed(self):
+        """Update the view-dependent artists after a zoom or pan."""
+    
+    def _can_blit(self):
+        """Check whether the canvas can blit the overlay artists."""
+        return bool(getattr(self.fig.canvas, 'supports_blit', False))
+    
+    def _create_annotation(self):
+        """Create the hidden tooltip annotation that every hover reuses."""
+        # Animated artists are skipped by full redraws and blitted instead;
+        # canvases that cannot blit draw the tooltip with everything else
+        annotation = self.ax.annotate(
+            '', xy=(0, 0), animated=self._can_blit(), **self.TOOLTIP_STYLE
+        )
+        annotation.set_visible(False)
+        return annotation
+    
+    def _tooltip_text(self, node):
+        """Get the text shown in the tooltip of a node."""
+        return self.get_cached_node_info(node)
+    
+    def show_tooltip(self, x, y, node):
+        """Show the hover tooltip with node information at (x, y)."""
+        if self.annotation is None:
+            self.annotation = self._create_annotation()
+        
+        self.annotation.xy = (x, y)
+        self.annotation.set_text(self._tooltip_text(node))
+        self.annotation.set_visible(True)
+        self._blit()
+    
+    def hide_tooltip(self):
+        """Hide the hover tooltip."""
+        # Explicit checks instead of exception handling on this hot path;
+        # hiding an already hidden tooltip needs no redraw at all
+        if self.annotation is None or not self.annotation.get_visible():
+            return
+        
+        self.annotation.set_visible(False)
+        self._blit()
+    
+    def _overlay_artists(self):
+        """Get the animated artists drawn over the cached background."""
+        return (self.annotation,)
+    
+    def _on_draw(self, event):
+        """Cache the freshly rendered axes as the background for blitting."""
+        canvas = self.fig.canvas
+        if canvas.is_saving():
+            return  # File exports render at another size; keep the screen background
+        if not self._can_blit():
+            self._background = None
+            return
+        
+        self._background = canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_overlay()
+    
+    def _draw_overlay(self):
+        """Draw the animated overlay artists on top of the current canvas."""
+        for artist in self._overlay_artists():
+            if artist is not None and artist.get_visible():
+                self.ax.draw_artist(artist)
+    
+    def _blit(self):
+        """Redraw only the overlay artists over the cached background.
+        
+        Falls back to a full (idle) redraw until the first draw has populated
+        the background cache or when the backend does not support blitting.
+        """
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw_idle()
+            return
+        
+        canvas.restore_region(self._background)
+        self._draw_overlay()
+        canvas.blit(self.ax.bbox)
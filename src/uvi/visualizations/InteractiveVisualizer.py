@@ -5,20 +5,54 @@ This module contains the InteractiveVisualizer class that adds interactive funct
 to the base Visualizer class, providing hover, click, and zoom functionality.
 """
 
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.patches import Patch
 from matplotlib.widgets import Button
 import datetime
 import os
 
+from .InteractionMixin import InteractionMixin
 from .Visualizer import Visualizer
 
 
-class InteractiveVisualizer(Visualizer):
+class InteractiveVisualizer(InteractionMixin, Visualizer):
     """Interactive visualization with hover, click, and zoom functionality."""
     
-    def __init__(self, G, hierarchy, title="Interactive Semantic Graph"):
-        super().__init__(G, hierarchy, title)
+    # Node sizes by node type; other node types use DEFAULT_NODE_SIZE
+    NODE_SIZES = {
+        'lexical_unit': 1000,   # Lexical units are smaller
+        'frame_element': 800,   # Frame elements are smallest
+    }
+    DEFAULT_NODE_SIZE = 2000
+    SELECTED_NODE_SIZE = 3000
+    NODE_ALPHA = 0.8
+    
+    # Above this many edges, arrows are dropped and edges are drawn as one
+    # LineCollection instead of one FancyArrowPatch per edge
+    FAST_EDGE_THRESHOLD = 200
+    
+    # Above LABEL_NODE_LIMIT nodes, labels are only drawn once zooming in
+    # leaves at most VISIBLE_LABEL_LIMIT nodes in view
+    LABEL_NODE_LIMIT = 500
+    VISIBLE_LABEL_LIMIT = 200
+    
+    def __init__(self, G, hierarchy, title="Interactive Semantic Graph", layout_cache_dir=None):
+        """
+        Initialize the interactive visualizer.
+        
+        Args:
+            G: NetworkX DiGraph
+            hierarchy: Hierarchy data (frame/synset structure)
+            title: Title for visualizations
+            layout_cache_dir: Optional directory in which computed layouts are
+                stored and reused across sessions; delete a cache file to
+                force a fresh layout
+        """
+        super().__init__(G, hierarchy, title, layout_cache_dir)
         self.fig = None
         self.ax = None
         self.pos = None
@@ -26,111 +60,164 @@ class InteractiveVisualizer(Visualizer):
         self.annotation = None
         self.selected_node = None
         self.save_button = None
+        self._background = None
+        self._selection_marker = None
+        self._selection_label = None
+        self._node_list = None
+        self._node_index = None
+        self._node_colors = None
+        self._node_sizes = None
+        self._styled_selection = None
+        self._last_hover_xy = None
+        self._last_hover_node = None
+        self._edge_collection = None
+        self._label_artists = {}
+        self._labeled_nodes = frozenset()
+        self._interaction_threshold = None
+        self._hover_cid = None
+        self._hover_timer = None
+        self._pending_hover = None
+        self._view_timer = None
+        self._legend_handles = None
+    
+    def _get_interaction_threshold(self):
+        """Get the hover/click radius in data coordinates for the current view."""
+        # The view limits only change on pan/zoom, which resets this cache
+        if self._interaction_threshold is not None:
+            return self._interaction_threshold
+        
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        x_range = xlim[1] - xlim[0]
+        y_range = ylim[1] - ylim[0]
+        
+        # Node size in data coordinates (approximate radius)
+        # Default node_size is 2000, which roughly corresponds to this threshold
+        self._interaction_threshold = min(x_range, y_range) * 0.05
+        return self._interaction_threshold
+    
+    def _invalidate_interaction_threshold(self, ax=None):
+        """Forget the cached interaction threshold after the view limits change."""
+        self._interaction_threshold = None
+    
+    def _hit_test_positions(self):
+        """Hit tests search the current layout."""
+        return self.pos
     
-    def on_hover(self, event):
-        """Handle mouse hover events."""
-        if event.inaxes != self.ax:
+    def _find_closest_node(self, x, y, threshold):
+        """Find the node nearest to (x, y) within threshold, or None."""
+        return self._nearest_node(x, y, threshold)
+    
+    def _process_hover(self, event):
+        """Show or hide the tooltip for the node under the mouse."""
+        # Axes are compared by identity; the data coordinates are only
+        # missing for events outside any axes
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        if not self.pos:
             return
         
         # Find the closest node within actual node boundaries
-        if self.pos and event.xdata is not None and event.ydata is not None:
-            closest_node = None
-            min_dist = float('inf')
-            
-            # Calculate appropriate hover threshold based on node size and axis limits
-            xlim = self.ax.get_xlim()
-            ylim = self.ax.get_ylim()
-            x_range = xlim[1] - xlim[0]
-            y_range = ylim[1] - ylim[0]
-            
-            # Node size in data coordinates (approximate radius)
-            # Default node_size is 2000, which roughly corresponds to this threshold
-            hover_threshold = min(x_range, y_range) * 0.05  # Much smaller threshold
-            
-            for node, (x, y) in self.pos.items():
-                dist = ((event.xdata - x) ** 2 + (event.ydata - y) ** 2) ** 0.5
-                if dist < hover_threshold:
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_node = node
-            
-            if closest_node and closest_node != self.selected_node:
-                # Show tooltip
-                self.show_tooltip(event.xdata, event.ydata, closest_node)
-            elif not closest_node:
-                self.hide_tooltip()
+        hover_threshold = self._get_interaction_threshold()
+        
+        # Ignore jitter that stays well inside the current node's radius
+        if self._last_hover_xy is not None:
+            dx = event.xdata - self._last_hover_xy[0]
+            dy = event.ydata - self._last_hover_xy[1]
+            jitter = hover_threshold * 0.25
+            if dx * dx + dy * dy < jitter * jitter:
+                return
+        
+        closest_node = self._find_closest_node(event.xdata, event.ydata, hover_threshold)
+        self._last_hover_xy = (event.xdata, event.ydata)
+        
+        # The tooltip already reflects this node (or the lack of one)
+        if closest_node == self._last_hover_node:
+            return
+        self._last_hover_node = closest_node
+        
+        if closest_node and closest_node != self.selected_node:
+            # Show tooltip
+            self.show_tooltip(event.xdata, event.ydata, closest_node)
+        elif not closest_node:
+            self.hide_tooltip()
     
     def on_click(self, event):
         """Handle mouse click events."""
-        if event.inaxes != self.ax:
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        if not self.pos:
             return
         
         # Find clicked node using same precise detection as hover
-        if self.pos and event.xdata is not None and event.ydata is not None:
-            closest_node = None
-            min_dist = float('inf')
-            
-            # Calculate appropriate click threshold based on node size and axis limits
-            xlim = self.ax.get_xlim()
-            ylim = self.ax.get_ylim()
-            x_range = xlim[1] - xlim[0]
-            y_range = ylim[1] - ylim[0]
-            
-            # Same threshold as hover for consistency
-            click_threshold = min(x_range, y_range) * 0.05
-            
-            for node, (x, y) in self.pos.items():
-                dist = ((event.xdata - x) ** 2 + (event.ydata - y) ** 2) ** 0.5
-                if dist < click_threshold:
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_node = node
-            
-            if closest_node:
-                self.select_node(closest_node)
+        click_threshold = self._get_interaction_threshold()
+        closest_node = self._find_closest_node(event.xdata, event.ydata, click_threshold)
+        
+        if closest_node:
+            self.select_node(closest_node)
     
-    def show_tooltip(self, x, y, node):
-        """Show tooltip with node information."""
-        if self.annotation:
-            self.annotation.remove()
-        
-        info = self.get_node_info(node)
-        self.annotation = self.ax.annotate(
-            info,
-            xy=(x, y),
-            xytext=(20, 20),
-            textcoords="offset points",
-            bbox=dict(boxstyle="round,pad=0.5", fc="wheat", alpha=0.8),
-            arrowprops=dict(arrowstyle="->", connectionstyle="arc3,rad=0"),
-            fontsize=9,
-            fontweight='normal'
-        )
-        self.fig.canvas.draw_idle()
+    def _suspend_hover(self, event):
+        """Stop handling hover events while the toolbar is panning or zooming."""
+        toolbar = self.fig.canvas.toolbar
+        if self._hover_cid is None or toolbar is None or not toolbar.mode:
+            return
+        
+        self.fig.canvas.mpl_disconnect(self._hover_cid)
+        self._hover_cid = None
+        if self._hover_timer is not None:
+            self._hover_timer.stop()
+        self._pending_hover = None
+        self.hide_tooltip()
+        self._last_hover_node = None
     
-    def hide_tooltip(self):
-        """Hide the tooltip."""
-        if self.annotation:
-            try:
-                self.annotation.set_visible(False)
-                self.fig.canvas.draw_idle()
-            except:
-                # If visibility toggle fails, try remove
-                try:
-                    self.annotation.remove()
-                except:
-                    pass
-            finally:
-                self.annotation = None
+    def _resume_hover(self, event):
+        """Reconnect the hover handler once a pan/zoom gesture ends."""
+        if self._hover_cid is not None:
+            return
+        
+        # Positions recorded before the gesture no longer match the view
+        self._last_hover_xy = None
+        self._hover_cid = self.fig.canvas.mpl_connect('motion_notify_event', self.on_hover)
+    
+    def _overlay_artists(self):
+        """Get the selection marker, its label and the tooltip as overlay artists."""
+        return (self._selection_marker, self._selection_label, self.annotation)
     
     def select_node(self, node):
         """Select a node and highlight it."""
         self.selected_node = node
         print(f"\n=== Selected Node: {node} ===")
-        print(self.get_node_info(node))
+        print(self.get_cached_node_info(node))
         print("=" * 40)
         
-        # Redraw with highlighted selection
-        self.draw_graph()
+        # Only the overlay changes; the base graph stays cached
+        self._update_selection_overlay()
+    
+    def _update_selection_overlay(self):
+        """Move the selection marker and its bold label onto the selected node."""
+        if self.ax is None or not self.pos or self.selected_node not in self.pos:
+            return
+        
+        x, y = self.pos[self.selected_node]
+        if self._selection_marker is None:
+            # Blitted like the tooltip, or drawn with the graph when the
+            # canvas cannot blit
+            animated = self._can_blit()
+            self._selection_marker = self.ax.scatter(
+                [x], [y], s=self.SELECTED_NODE_SIZE, c='red', alpha=self.NODE_ALPHA,
+                zorder=3, animated=animated
+            )
+            self._selection_label = self.ax.text(
+                x, y, str(self.selected_node),
+                fontsize=8, fontweight='bold',
+                ha='center', va='center', zorder=4, animated=animated
+            )
+        else:
+            self._selection_marker.set_offsets([[x, y]])
+            self._selection_label.set_position((x, y))
+            self._selection_label.set_text(str(self.selected_node))
+        
+        self._blit()
     
     def save_png(self, event=None):
         """Save the current graph visualization as a PNG file."""
@@ -138,24 +225,52 @@ class InteractiveVisualizer(Visualizer):
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"semantic_graph_{timestamp}.png"
         
-        # Try to save in current directory, fall back to user's home directory
+        # Large graphs are shown with arrow-free edges; the export gets arrows
+        export_arrows = self._add_export_arrows()
         try:
-            # First try current directory
-            filepath = filename
-            self.fig.savefig(filepath, dpi=300, bbox_inches='tight', 
-                           facecolor='white', edgecolor='none')
-            print(f"Graph saved as: {os.path.abspath(filepath)}")
-        except (PermissionError, OSError):
+            # Try to save in current directory, fall back to user's home directory
             try:
-                # Fall back to home directory
-                home_dir = os.path.expanduser("~")
-                filepath = os.path.join(home_dir, filename)
-                self.fig.savefig(filepath, dpi=300, bbox_inches='tight',
+                # First try current directory
+                filepath = filename
+                self.fig.savefig(filepath, dpi=300, bbox_inches='tight', 
                                facecolor='white', edgecolor='none')
-                print(f"Graph saved as: {filepath}")
-            except Exception as e:
-                print(f"Error saving graph: {e}")
-                print("Please check file permissions and available disk space")
+                print(f"Graph saved as: {os.path.abspath(filepath)}")
+            except (PermissionError, OSError):
+                try:
+                    # Fall back to home directory
+                    home_dir = os.path.expanduser("~")
+                    filepath = os.path.join(home_dir, filename)
+                    self.fig.savefig(filepath, dpi=300, bbox_inches='tight',
+                                   facecolor='white', edgecolor='none')
+                    print(f"Graph saved as: {filepath}")
+                except Exception as e:
+                    print(f"Error saving graph: {e}")
+                    print("Please check file permissions and available disk space")
+        finally:
+            self._remove_export_arrows(export_arrows)
+    
+    def _add_export_arrows(self):
+        """Swap the fast edge collection for arrow patches ahead of a file export."""
+        if self._edge_collection is None:
+            return []
+        
+        self._edge_collection.set_visible(False)
+        return nx.draw_networkx_edges(
+            self.G, self.pos,
+            edge_color='gray',
+            arrows=True,
+            arrowsize=20,
+            arrowstyle='->',
+            alpha=0.6,
+            ax=self.ax
+        )
+    
+    def _remove_export_arrows(self, arrows):
+        """Remove export-only arrow patches and show the fast edge collection again."""
+        for arrow in arrows:
+            arrow.remove()
+        if self._edge_collection is not None:
+            self._edge_collection.set_visible(True)
     
     def get_node_color(self, node):
         """Get color for a node based on DAG properties and selection state."""
@@ -164,81 +279,199 @@ class InteractiveVisualizer(Visualizer):
         
         return self.get_dag_node_color(node)
     
+    def _build_node_styles(self):
+        """Precompute per-node RGBA colors and sizes in a stable node order."""
+        self._node_list = list(self.G.nodes())
+        self._node_index = {node: i for i, node in enumerate(self._node_list)}
+        
+        # Hoist the size table lookups out of the per-node loop
+        sizes = self.NODE_SIZES
+        default_size = self.DEFAULT_NODE_SIZE
+        selected_size = self.SELECTED_NODE_SIZE
+        selected = self.selected_node
+        self._node_sizes = np.array([
+            selected_size if node == selected
+            else sizes.get(data.get('node_type', 'default'), default_size)
+            for node, data in self.G.nodes(data=True)
+        ], dtype=float)
+        self._node_colors = to_rgba_array(
+            [self.get_node_color(node) for node in self._node_list]
+        )
+        self._styled_selection = selected
+    
+    def _restyle_nodes(self, nodes):
+        """Recompute the cached color and size of just the given nodes."""
+        sizes = self.NODE_SIZES
+        for node in nodes:
+            i = self._node_index.get(node)
+            if i is None:
+                continue
+            
+            if node == self.selected_node:
+                size = self.SELECTED_NODE_SIZE
+            else:
+                node_type = self.G.nodes[node].get('node_type', 'default')
+                size = sizes.get(node_type, self.DEFAULT_NODE_SIZE)
+            self._node_sizes[i] = size
+            self._node_colors[i] = to_rgba_array(self.get_node_color(node))[0]
+    
+    def _draw_edges_fast(self):
+        """Draw all edges as a single arrow-free LineCollection."""
+        pos = self.pos
+        segments = np.array(
+            [(pos[u], pos[v]) for u, v in self.G.edges()], dtype=float
+        )
+        self._edge_collection = LineCollection(
+            segments, colors='gray', alpha=0.6, linewidths=1.0, zorder=1
+        )
+        self.ax.add_collection(self._edge_collection)
+    
+    def _on_view_changed(self):
+        """Label only the nodes in view once few enough of them are visible."""
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        
+        # One vectorized bounds test over the cached position array
+        self._ensure_pos_cache()
+        xs = self._pos_xy[:, 0]
+        ys = self._pos_xy[:, 1]
+        in_view = np.flatnonzero((x0 <= xs) & (xs <= x1) & (y0 <= ys) & (ys <= y1))
+        if len(in_view) > self.VISIBLE_LABEL_LIMIT:
+            visible = frozenset()
+        else:
+            nodes = self._pos_nodes
+            visible = frozenset(nodes[i] for i in in_view)
+        
+        # Panning within the same set of nodes needs no new text artists
+        if visible == self._labeled_nodes:
+            return
+        
+        for text in self._label_artists.values():
+            text.remove()
+        self._label_artists = {}
+        if visible:
+            self._label_artists = nx.draw_networkx_labels(
+                self.G, self.pos,
+                labels={node: node for node in visible},
+                font_size=8,
+                font_weight='bold',
+                ax=self.ax
+            )
+        self._labeled_nodes = visible
+    
     def draw_graph(self):
         """Draw the graph with current state."""
         self.ax.clear()
         
-        # Color and size nodes based on type and selection
-        node_colors = [self.get_node_color(node) for node in self.G.nodes()]
-        node_sizes = []
+        # Clearing the axes discarded the overlay artists as well, and the
+        # cached background shows the old graph until the next draw event
+        self._selection_marker = None
+        self._selection_label = None
+        self._background = None
         
-        for node in self.G.nodes():
-            node_data = self.G.nodes.get(node, {})
-            node_type = node_data.get('node_type', 'default')
-            
-            if node == self.selected_node:
-                size = 3000  # Selected nodes are largest
-            elif node_type == 'lexical_unit':
-                size = 1000  # Lexical units are smaller
-            elif node_type == 'frame_element':
-                size = 800   # Frame elements are smallest
-            else:
-                size = 2000  # Default size for other nodes
-            
-            node_sizes.append(size)
+        # Axes callbacks are reset by ax.clear(), so reconnect on every draw
+        self._interaction_threshold = None
+        self.ax.callbacks.connect('xlim_changed', self._invalidate_interaction_threshold)
+        self.ax.callbacks.connect('ylim_changed', self._invalidate_interaction_threshold)
         
-        # Draw nodes
-        nx.draw_networkx_nodes(
-            self.G, self.pos,
-            node_color=node_colors,
-            node_size=node_sizes,
-            alpha=0.8,
-            ax=self.ax
-        )
+        # Color and size nodes based on type and selection; only the
+        # previously and newly selected nodes change between draws
+        if self._node_sizes is None:
+            self._build_node_styles()
+        elif self._styled_selection != self.selected_node:
+            self._restyle_nodes((self._styled_selection, self.selected_node))
+            self._styled_selection = self.selected_node
         
-        # Draw labels
-        nx.draw_networkx_labels(
-            self.G, self.pos,
-            font_size=8,
-            font_weight='bold',
-            ax=self.ax
+        # Draw nodes straight from the cached position array
+        self._ensure_pos_cache()
+        if self._pos_nodes == self._node_list:
+            xy = self._pos_xy
+        else:
+            xy = np.array([self.pos[node] for node in self._node_list], dtype=float)
+        self.node_artists = self.ax.scatter(
+            xy[:, 0], xy[:, 1],
+            c=self._node_colors,
+            s=self._node_sizes,
+            alpha=self.NODE_ALPHA,
+            zorder=2
         )
         
+        # Draw labels (level of detail: large graphs label only zoomed-in views)
+        self._label_artists = {}
+        self._labeled_nodes = frozenset()
+        if len(self.G) <= self.LABEL_NODE_LIMIT:
+            self._label_artists = nx.draw_networkx_labels(
+                self.G, self.pos,
+                font_size=8,
+                font_weight='bold',
+                ax=self.ax
+            )
+        else:
+            self.ax.callbacks.connect('xlim_changed', self._schedule_view_update)
+            self.ax.callbacks.connect('ylim_changed', self._schedule_view_update)
+        
         # Draw edges
-        nx.draw_networkx_edges(
-            self.G, self.pos,
-            edge_color='gray',
-            arrows=True,
-            arrowsize=20,
-            arrowstyle='->',
-            alpha=0.6,
-            ax=self.ax
-        )
+        if self.G.number_of_edges() > self.FAST_EDGE_THRESHOLD:
+            self._draw_edges_fast()
+        else:
+            self._edge_collection = None
+            nx.draw_networkx_edges(
+                self.G, self.pos,
+                edge_color='gray',
+                arrows=True,
+                arrowsize=20,
+                arrowstyle='->',
+                alpha=0.6,
+                ax=self.ax
+            )
         
         self.ax.set_title(self.title, fontsize=16, fontweight='bold')
         self.ax.axis('off')
         
         # Add legend
-        from matplotlib.patches import Patch
-        legend_elements = self.create_dag_legend()
-        legend_elements.append(Patch(facecolor='red', label='Selected Node'))
-        self.ax.legend(handles=legend_elements, loc='upper right')
+        self.ax.legend(handles=self._get_legend_handles(), loc='upper right')
+        
+        self.annotation = self._create_annotation()
+    
+    def _get_legend_handles(self):
+        """Get the legend handles, building them on the first draw only."""
+        if self._legend_handles is None:
+            self._legend_handles = self.create_dag_legend()
+            self._legend_handles.append(Patch(facecolor='red', label='Selected Node'))
+        return self._legend_handles
     
     def create_interactive_plot(self):
         """Create the interactive matplotlib plot."""
         # Create figure and axis
         self.fig, self.ax = plt.subplots(figsize=(16, 12))
         
-        # Create layout
-        self.pos = self.create_dag_layout()
+        # Create layout, reusing a cached one when available
+        self.pos = self.load_or_create_layout()
+        self._build_node_styles()
+        
+        # Tooltips are formatted now rather than during the first hovers
+        self.precompute_node_info()
         
         # Initial draw
         self.draw_graph()
         
+        # Coalesce bursts of motion events into one hover update per interval
+        self._hover_timer = self._create_hover_timer()
+        # A zoom or pan relabels large graphs once, not once per axis
+        self._view_timer = self._create_view_timer()
+        
         # Connect interactive events
-        self.fig.canvas.mpl_connect('motion_notify_event', self.on_hover)
+        self._hover_cid = self.fig.canvas.mpl_connect('motion_notify_event', self.on_hover)
         self.fig.canvas.mpl_connect('button_press_event', self.on_click)
         
+        # Hovering is suspended for the duration of toolbar pan/zoom drags
+        self.fig.canvas.mpl_connect('button_press_event', self._suspend_hover)
+        self.fig.canvas.mpl_connect('button_release_event', self._resume_hover)
+        
+        # Recapture the blitting background after every full redraw
+        # (initial show, resize, zoom and pan all emit a draw event)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        
         # Add navigation toolbar for zoom/pan and save button
         plt.subplots_adjust(bottom=0.15)  # Make more room for button
         
@@ -7,18 +7,165 @@ FrameNet, and WordNet corpora.
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from matplotlib.patches import Patch
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba, to_rgba_array
 from matplotlib.widgets import Button
 import networkx as nx
+import numpy as np
 from typing import Dict, Any, Optional
 
+from .FrameNetVisualizer import _ellipsize
+from .InteractionMixin import InteractionMixin
 from .Visualizer import Visualizer
 
+# Corpus groups by node prefix, in drawing order; other nodes form the
+# last group
+_VN, _FN, _WN, _VERB, _OTHER = range(5)
+_PREFIX_GROUPS = {'VN:': _VN, 'FN:': _FN, 'WN:': _WN, 'VERB:': _VERB}
 
-class VerbNetFrameNetWordNetVisualizer(Visualizer):
+# Label offsets from the node position by corpus group: VerbNet below,
+# FrameNet above, WordNet to the right, everything else centred
+_LABEL_OFFSETS = np.array([
+    (0.0, -0.08),
+    (0.0, 0.08),
+    (0.08, 0.0),
+    (0.0, 0.0),
+    (0.0, 0.0),
+])
+
+# Fill colors by corpus node prefix; other nodes are light gray
+_PREFIX_COLORS = {
+    'VN:': '#4A90E2',    # Blue for VerbNet
+    'FN:': '#7B68EE',    # Purple for FrameNet
+    'WN:': '#50C878',    # Green for WordNet
+    'VERB:': '#FFB84D',  # Orange for member verbs
+}
+
+# The same colors as RGBA rows indexed by corpus group
+_GROUP_RGBA = to_rgba_array([
+    _PREFIX_COLORS[prefix] for prefix in sorted(_PREFIX_GROUPS, key=_PREFIX_GROUPS.get)
+] + ['lightgray'])
+
+# Edge styles while a node is highlighted, as (RGBA color, width, arrow
+# size): the selected node's own edges, the rest of its neighborhood and
+# every other edge
+_EDGE_SELECTED = (to_rgba('red', 0.8), 3.0, 20)
+_EDGE_NEIGHBORHOOD = (to_rgba('black', 0.8), 1.5, 20)
+_EDGE_GREYED = (to_rgba('lightgray', 0.2), 0.5, 10)
+
+# Node size, marker and alpha by corpus group
+_GROUP_STYLES = (
+    (3000, 's', 0.9),    # Square for VerbNet
+    (2500, '^', 0.9),    # Triangle for FrameNet
+    (2500, 'd', 0.9),    # Diamond for WordNet
+    (1500, 'o', 0.9),    # Circle for verbs
+    (1500, 'o', 0.7),
+)
+
+
+# Longest definitions shown in node details, including the trailing ellipsis
+_DEFINITION_LIMIT = 100
+
+
+def _summarize(items):
+    """List up to five items in full, otherwise the first three and a count."""
+    if len(items) <= 5:
+        return ', '.join(items)
+    return f"{', '.join(items[:3])}... ({len(items)} total)"
+
+
+def _verbnet_class_info(node, node_info):
+    """Detail lines for a VerbNet class node."""
+    get = node_info.get
+    info = [f"VerbNet Class: {node}", f"Class ID: {get('class_id', 'Unknown')}"]
+    
+    members = get('members', [])
+    if members:
+        info.append(f"Members: {_summarize(members)}")
+    
+    themroles = get('themroles', [])
+    if themroles:
+        if len(themroles) <= 5:
+            info.append(f"Thematic Roles: {', '.join(themroles)}")
+        else:
+            info.append(f"Thematic Roles: {len(themroles)} roles")
+    return info
+
+
+def _framenet_frame_info(node, node_info):
+    """Detail lines for a FrameNet frame node."""
+    get = node_info.get
+    info = [f"FrameNet Frame: {node}", f"Frame: {get('frame_name', 'Unknown')}"]
+    
+    definition = get('definition', '')
+    if definition:
+        info.append(f"Definition: {_ellipsize(definition, _DEFINITION_LIMIT)}")
+    
+    info.append(f"Lexical Units: {get('lexical_units', 0)}")
+    return info
+
+
+def _wordnet_synset_info(node, node_info):
+    """Detail lines for a WordNet synset node."""
+    get = node_info.get
+    info = [f"WordNet Synset: {node}", f"Synset ID: {get('synset_id', 'Unknown')}"]
+    
+    words = get('words', [])
+    if words:
+        info.append(f"Words: {_summarize(words)}")
+    
+    definition = get('definition', '')
+    if definition:
+        info.append(f"Definition: {_ellipsize(definition, _DEFINITION_LIMIT)}")
+    return info
+
+
+def _verb_member_info(node, node_info):
+    """Detail lines for a member verb node."""
+    info = [f"Member Verb: {node}", f"Lemma: {node_info.get('lemma', 'Unknown')}"]
+    
+    vn_class = node_info.get('verbnet_class', '')
+    if vn_class:
+        info.append(f"VerbNet Class: {vn_class}")
+    return info
+
+
+# Detail line builders by node type; other types use the generic details
+_INFO_BUILDERS = {
+    'verbnet_class': _verbnet_class_info,
+    'framenet_frame': _framenet_frame_info,
+    'wordnet_synset': _wordnet_synset_info,
+    'verb_member': _verb_member_info,
+}
+
+
+class VerbNetFrameNetWordNetVisualizer(InteractionMixin, Visualizer):
     """Specialized visualizer for integrated VerbNet-FrameNet-WordNet graphs."""
     
-    def __init__(self, G, hierarchy, title="Integrated Semantic Graph"):
+    # Data-space radius within which hover and click pick a node
+    PICK_RADIUS = 0.1
+    
+    # Above this many edges, arrows are dropped and edges are drawn as one
+    # LineCollection instead of one FancyArrowPatch per edge
+    FAST_EDGE_THRESHOLD = 200
+    
+    # From this many nodes, nodes landing within LOD_PIXELS of an already
+    # shown node on screen are hidden along with their labels; zooming in
+    # brings them back
+    LOD_NODE_THRESHOLD = 500
+    LOD_PIXELS = 3
+    # Labels of such large graphs are only drawn for shown nodes inside the
+    # view, once at most this many of them are in view
+    VISIBLE_LABEL_LIMIT = 300
+    
+    # Hover events are coalesced so that at most one is processed per interval
+    HOVER_INTERVAL_MS = 30
+    
+    # Longest node description shown in the hover tooltip
+    TOOLTIP_MAX_CHARS = 200
+    
+    def __init__(self, G, hierarchy, title="Integrated Semantic Graph", layout_cache_dir=None):
         """
         Initialize the integrated visualizer.
         
@@ -26,26 +173,49 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
             G: NetworkX DiGraph containing integrated corpus nodes
             hierarchy: Hierarchy data with node information
             title: Title for visualizations
+            layout_cache_dir: Optional directory in which computed layouts are
+                stored and reused across sessions
         """
-        super().__init__(G, hierarchy, title)
+        super().__init__(G, hierarchy, title, layout_cache_dir)
         self.selected_node = None
         self.node_positions = None
         self.ax = None
         self.fig = None
+        self._preds = None
+        self._succs = None
+        self._incident = None
+        self._adjacency_key = None
+        self._node_groups = None
+        self._node_groups_key = None
+        self._group_nodes = None
+        self._group_colors = None
+        self._labels = None
+        self._label_pos = None
+        self._label_pos_source = None
+        self._node_collections = None
+        self._node_slots = None
+        self._node_sizes = None
+        self._lod_visible = None
+        self._slot_rows = None
+        self._pos_hidden = None
+        self._edge_patches = None
+        self._edge_collection = None
+        self._edge_index = None
+        self._label_texts = None
+        self._emphasized = None
+        self._highlighted = None
+        self._hovered_node = None
+        self._last_hover_xy = None
+        self._hover_timer = None
+        self._pending_hover = None
+        self._view_timer = None
+        self.annotation = None
+        self._background = None
     
     def get_dag_node_color(self, node):
         """Get color for a node based on its corpus type."""
-        # Determine corpus from node prefix
-        if node.startswith('VN:'):
-            return '#4A90E2'  # Blue for VerbNet
-        elif node.startswith('FN:'):
-            return '#7B68EE'  # Purple for FrameNet
-        elif node.startswith('WN:'):
-            return '#50C878'  # Green for WordNet
-        elif node.startswith('VERB:'):
-            return '#FFB84D'  # Orange for member verbs
-        else:
-            return 'lightgray'  # Default
+        # Determine corpus from node prefix (empty when there is no colon)
+        return _PREFIX_COLORS.get(node[:node.find(':') + 1], 'lightgray')
     
     def get_taxonomic_node_color(self, node):
         """Get color for taxonomic visualization based on corpus."""
@@ -58,9 +228,8 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
             return f"Node: {node}\nNo additional information available."
         
         data = self.hierarchy[node]
-        info = []
         
-        # Determine node type and corpus
+        # Find the per-corpus details of the node
         node_info = None
         for key in ['node_info', 'frame_info', 'synset_info', 'verb_info']:
             if key in data:
@@ -70,69 +239,11 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
         if not node_info:
             return super().get_node_info(node)
         
-        node_type = node_info.get('node_type', 'unknown')
-        corpus = node_info.get('corpus', '')
-        
         # Format based on node type
-        if node_type == 'verbnet_class':
-            info.append(f"VerbNet Class: {node}")
-            info.append(f"Class ID: {node_info.get('class_id', 'Unknown')}")
-            
-            members = node_info.get('members', [])
-            if members:
-                if len(members) <= 5:
-                    info.append(f"Members: {', '.join(members)}")
-                else:
-                    info.append(f"Members: {', '.join(members[:3])}... ({len(members)} total)")
-            
-            themroles = node_info.get('themroles', [])
-            if themroles:
-                if len(themroles) <= 5:
-                    info.append(f"Thematic Roles: {', '.join(themroles)}")
-                else:
-                    info.append(f"Thematic Roles: {len(themroles)} roles")
-        
-        elif node_type == 'framenet_frame':
-            info.append(f"FrameNet Frame: {node}")
-            info.append(f"Frame: {node_info.get('frame_name', 'Unknown')}")
-            
-            definition = node_info.get('definition', '')
-            if definition:
-                # Truncate long definitions
-                if len(definition) > 100:
-                    definition = definition[:97] + "..."
-                info.append(f"Definition: {definition}")
-            
-            lexical_units = node_info.get('lexical_units', 0)
-            info.append(f"Lexical Units: {lexical_units}")
-        
-        elif node_type == 'wordnet_synset':
-            info.append(f"WordNet Synset: {node}")
-            info.append(f"Synset ID: {node_info.get('synset_id', 'Unknown')}")
-            
-            words = node_info.get('words', [])
-            if words:
-                if len(words) <= 5:
-                    info.append(f"Words: {', '.join(words)}")
-                else:
-                    info.append(f"Words: {', '.join(words[:3])}... ({len(words)} total)")
-            
-            definition = node_info.get('definition', '')
-            if definition:
-                if len(definition) > 100:
-                    definition = definition[:97] + "..."
-                info.append(f"Definition: {definition}")
-        
-        elif node_type == 'verb_member':
-            info.append(f"Member Verb: {node}")
-            info.append(f"Lemma: {node_info.get('lemma', 'Unknown')}")
-            
-            vn_class = node_info.get('verbnet_class', '')
-            if vn_class:
-                info.append(f"VerbNet Class: {vn_class}")
-        
-        else:
+        builder = _INFO_BUILDERS.get(node_info.get('node_type', 'unknown'))
+        if builder is None:
             return super().get_node_info(node)
+        info = builder(node, node_info)
         
         # Add connection information
         parents = data.get('parents', [])
@@ -155,11 +266,11 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
     def create_dag_legend(self):
         """Create legend elements for integrated DAG visualization."""
         return [
-            mpatches.Patch(facecolor='#4A90E2', label='VerbNet Classes'),
-            mpatches.Patch(facecolor='#7B68EE', label='FrameNet Frames'),
-            mpatches.Patch(facecolor='#50C878', label='WordNet Synsets'),
-            mpatches.Patch(facecolor='#FFB84D', label='Member Verbs'),
-            mpatches.Patch(facecolor='lightgray', label='Other Nodes')
+            Patch(facecolor='#4A90E2', label='VerbNet Classes'),
+            Patch(facecolor='#7B68EE', label='FrameNet Frames'),
+            Patch(facecolor='#50C878', label='WordNet Synsets'),
+            Patch(facecolor='#FFB84D', label='Member Verbs'),
+            Patch(facecolor='lightgray', label='Other Nodes')
         ]
     
     def create_taxonomic_legend(self):
@@ -171,8 +282,11 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
         """Create an interactive matplotlib plot with hover and click functionality."""
         self.fig, self.ax = plt.subplots(figsize=(18, 14))
         
-        # Create layout - use spring layout with adjustments for clarity
-        self.node_positions = self.create_dag_layout()
+        # Create layout - use spring layout with adjustments for clarity,
+        # reusing a cached one when available
+        self.node_positions = self.load_or_create_layout()
+        self._ensure_neighbor_cache()
+        self.precompute_node_info()
         
         # Draw the graph
         self._draw_graph()
@@ -198,8 +312,19 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
         self._add_corpus_labels()
         
         # Set up event handlers
-        self.fig.canvas.mpl_connect('motion_notify_event', self._on_hover)
+        self.ax.callbacks.connect('xlim_changed', self._reset_last_hover)
+        self.ax.callbacks.connect('ylim_changed', self._reset_last_hover)
+        self.ax.callbacks.connect('xlim_changed', self._schedule_view_update)
+        self.ax.callbacks.connect('ylim_changed', self._schedule_view_update)
+        # A zoom or pan sets both limits; the LOD pass runs once afterwards
+        self._view_timer = self._create_view_timer()
+        # Coalesce bursts of motion events into one hover update per interval
+        self._hover_timer = self._create_hover_timer()
+        self.fig.canvas.mpl_connect('motion_notify_event', self.on_hover)
         self.fig.canvas.mpl_connect('button_press_event', self._on_click)
+        # Every full redraw (initial show, resize, zoom, pan, highlight)
+        # refreshes the background the tooltip is blitted onto
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Add save button
         save_ax = plt.axes([0.85, 0.95, 0.1, 0.04])
@@ -207,130 +332,106 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
         save_btn.on_clicked(self._save_png)
         
         plt.tight_layout()
+        self._update_lod()
         return self.fig
     
     def _draw_graph(self):
         """Draw the integrated graph with corpus-specific styling."""
         # Separate nodes by corpus for different styling
-        vn_nodes = [n for n in self.G.nodes() if n.startswith('VN:')]
-        fn_nodes = [n for n in self.G.nodes() if n.startswith('FN:')]
-        wn_nodes = [n for n in self.G.nodes() if n.startswith('WN:')]
-        verb_nodes = [n for n in self.G.nodes() if n.startswith('VERB:')]
-        other_nodes = [n for n in self.G.nodes() 
-                      if not any(n.startswith(p) for p in ['VN:', 'FN:', 'WN:', 'VERB:'])]
-        
-        # Draw nodes by corpus with different styles
-        if vn_nodes:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=vn_nodes,
-                                 node_color='#4A90E2',
-                                 node_size=3000,
-                                 node_shape='s',  # Square for VerbNet
-                                 alpha=0.9,
-                                 ax=self.ax)
-        
-        if fn_nodes:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=fn_nodes,
-                                 node_color='#7B68EE',
-                                 node_size=2500,
-                                 node_shape='^',  # Triangle for FrameNet
-                                 alpha=0.9,
-                                 ax=self.ax)
-        
-        if wn_nodes:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=wn_nodes,
-                                 node_color='#50C878',
-                                 node_size=2500,
-                                 node_shape='d',  # Diamond for WordNet
-                                 alpha=0.9,
-                                 ax=self.ax)
-        
-        if verb_nodes:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=verb_nodes,
-                                 node_color='#FFB84D',
-                                 node_size=1500,
-                                 node_shape='o',  # Circle for verbs
-                                 alpha=0.9,
-                                 ax=self.ax)
-        
-        if other_nodes:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=other_nodes,
-                                 node_color='lightgray',
-                                 node_size=1500,
-                                 alpha=0.7,
+        self._ensure_node_groups()
+        groups = self._node_groups
+        
+        # Draw nodes by corpus with different styles, one scatter per group,
+        # keeping each collection so that highlighting can restyle it in place
+        pos = self.node_positions
+        self._node_collections = []
+        self._node_slots = {}
+        self._node_sizes = []
+        self._lod_visible = None
+        for group, nodelist in enumerate(self._group_nodes):
+            if nodelist:
+                size, shape, alpha = _GROUP_STYLES[group]
+                base_colors = self._group_colors[group]
+                xy = np.array([pos[n] for n in nodelist], dtype=float)
+                collection = self.ax.scatter(xy[:, 0], xy[:, 1],
+                                             c=base_colors,
+                                             s=size,
+                                             marker=shape,
+                                             alpha=alpha,
+                                             edgecolors='face',
+                                             zorder=2)
+                for i, n in enumerate(nodelist):
+                    self._node_slots[n] = (len(self._node_collections), i)
+                self._node_collections.append((nodelist, collection, base_colors))
+                self._node_sizes.append(np.full(len(nodelist), float(size)))
+        
+        # Position cache row of every node, in collection order, so that the
+        # LOD pass can tell hit tests which nodes it hid
+        self._ensure_pos_cache()
+        rows = {n: i for i, n in enumerate(self._pos_nodes)}
+        self._slot_rows = np.fromiter((rows[n] for nodelist, _, _ in self._node_collections
+                                       for n in nodelist),
+                                      dtype=np.intp, count=len(self._node_slots))
+        self._pos_hidden = None
+        
+        # Style edges by connection type, computed for all edges at once from
+        # the endpoint corpus groups
+        edges = list(self.G.edges(data='relation_type', default='default'))
+        n_edges = len(edges)
+        source = np.fromiter((groups[u] for u, _, _ in edges), dtype=np.intp, count=n_edges)
+        target = np.fromiter((groups[v] for _, v, _ in edges), dtype=np.intp, count=n_edges)
+        conditions = [
+            np.fromiter((rel == 'semantic_similarity' for _, _, rel in edges),
+                        dtype=bool, count=n_edges),
+            (source == _VN) & (target == _FN),
+            (source == _VN) & (target == _WN),
+            (source == _FN) & (target == _WN),
+        ]
+        # Purple for similarity, blue for VN-FN, green for VN-WN, purple for FN-WN
+        edge_colors = np.select(conditions, ['purple', 'blue', 'green', 'purple'], default='gray')
+        edge_widths = np.select(conditions, [1.5, 2.0, 2.0, 1.5], default=1.0)
+        # Dotted for similarity, dashed for FN-WN, solid otherwise
+        edge_styles = np.select(conditions, [':', '-', '-', '--'], default='-')
+        
+        # Draw edges; large graphs get a single LineCollection without arrows
+        self._edge_index = {(u, v): i for i, (u, v, _) in enumerate(edges)}
+        if n_edges > self.FAST_EDGE_THRESHOLD:
+            segments = np.array([(pos[u], pos[v]) for u, v, _ in edges], dtype=float)
+            self._edge_collection = LineCollection(segments,
+                                                   colors=to_rgba_array(edge_colors, 0.6),
+                                                   linewidths=edge_widths,
+                                                   linestyles=edge_styles.tolist(),
+                                                   zorder=1)
+            self.ax.add_collection(self._edge_collection)
+            self._edge_patches = {}
+        else:
+            edge_patches = nx.draw_networkx_edges(self.G, self.node_positions,
+                                 edge_color=edge_colors.tolist(),
+                                 width=edge_widths.tolist(),
+                                 alpha=0.6,
+                                 arrows=True,
+                                 arrowsize=15,
+                                 arrowstyle='->',
                                  ax=self.ax)
-        
-        # Draw edges with different styles for different connection types
-        edge_colors = []
-        edge_styles = []
-        edge_widths = []
-        
-        for edge in self.G.edges(data=True):
-            source, target, attrs = edge
-            relation_type = attrs.get('relation_type', 'default')
-            
-            # Style based on connection type
-            if relation_type == 'semantic_similarity':
-                edge_colors.append('purple')
-                edge_styles.append(':')  # Dotted for similarity
-                edge_widths.append(1.5)
-            elif source.startswith('VN:') and target.startswith('FN:'):
-                edge_colors.append('blue')
-                edge_styles.append('-')  # Solid for VN-FN
-                edge_widths.append(2)
-            elif source.startswith('VN:') and target.startswith('WN:'):
-                edge_colors.append('green')
-                edge_styles.append('-')  # Solid for VN-WN
-                edge_widths.append(2)
-            elif source.startswith('FN:') and target.startswith('WN:'):
-                edge_colors.append('purple')
-                edge_styles.append('--')  # Dashed for FN-WN
-                edge_widths.append(1.5)
-            else:
-                edge_colors.append('gray')
-                edge_styles.append('-')
-                edge_widths.append(1)
-        
-        # Draw edges
-        nx.draw_networkx_edges(self.G, self.node_positions,
-                             edge_color=edge_colors,
-                             width=edge_widths,
-                             alpha=0.6,
-                             arrows=True,
-                             arrowsize=15,
-                             arrowstyle='->',
-                             ax=self.ax)
-        
-        # Draw labels with adjusted positions to avoid overlap
-        label_pos = {}
-        for node, (x, y) in self.node_positions.items():
-            # Adjust label position based on node type
-            if node.startswith('VN:'):
-                label_pos[node] = (x, y - 0.08)
-            elif node.startswith('FN:'):
-                label_pos[node] = (x, y + 0.08)
-            elif node.startswith('WN:'):
-                label_pos[node] = (x + 0.08, y)
-            else:
-                label_pos[node] = (x, y)
-        
-        # Format labels (remove corpus prefix for display)
-        labels = {}
-        for node in self.G.nodes():
-            if ':' in node:
-                labels[node] = node.split(':', 1)[1]
-            else:
-                labels[node] = node
-        
-        nx.draw_networkx_labels(self.G, label_pos,
-                              labels=labels,
-                              font_size=8,
-                              font_weight='bold',
-                              ax=self.ax)
+            # Arrow patches take one line style each; most edges keep solid
+            for arrow, style in zip(edge_patches, edge_styles):
+                if style != '-':
+                    arrow.set_linestyle(style)
+            self._edge_collection = None
+            self._edge_patches = dict(zip(self.G.edges(), edge_patches))
+        
+        # Draw labels with adjusted positions to avoid overlap, without their
+        # corpus prefix; both are reused until the layout or graph changes
+        label_pos, labels = self._get_label_layout()
+        
+        # One Text per node, created directly; highlighting restyles them
+        text = self.ax.text
+        self._label_texts = {
+            n: text(x, y, labels[n], fontsize=8, fontweight='bold',
+                    ha='center', va='center', clip_on=True)
+            for n, (x, y) in label_pos.items()
+        }
+        self._emphasized = None
     
     def _add_corpus_labels(self):
         """Add corpus section labels to the visualization."""
@@ -348,128 +449,303 @@ class VerbNetFrameNetWordNetVisualizer(Visualizer):
                          color=color, va='top')
             y_offset -= 0.03
     
-    def _on_hover(self, event):
-        """Handle mouse hover events to show node information."""
-        if event.inaxes != self.ax:
+    def _process_hover(self, event):
+        """Show or hide the tooltip for the node under the mouse."""
+        if event.inaxes is not self.ax:
             return
         
+        # Ignore jitter that stays well inside the current node's radius
+        if self._last_hover_xy is not None:
+            dx = event.xdata - self._last_hover_xy[0]
+            dy = event.ydata - self._last_hover_xy[1]
+            jitter = self.PICK_RADIUS * 0.25
+            if dx * dx + dy * dy < jitter * jitter:
+                return
+        
         # Find closest node to mouse position
-        closest_node = None
-        min_dist = float('inf')
+        closest_node = self._find_node_at(event.xdata, event.ydata)
+        self._last_hover_xy = (event.xdata, event.ydata)
         
-        for node, (x, y) in self.node_positions.items():
-            dist = ((event.xdata - x) ** 2 + (event.ydata - y) ** 2) ** 0.5
-            if dist < min_dist and dist < 0.1:  # Threshold for hover detection
-                min_dist = dist
-                closest_node = node
+        # The tooltip already describes this node (or the lack of one)
+        if closest_node == self._hovered_node:
+            return
+        self._hovered_node = closest_node
         
-        # Update annotation
         if closest_node:
-            info = self.get_node_info(closest_node)
-            # Show as tooltip (simplified for matplotlib)
-            self.ax.set_title(f"{self.title}\n{info[:200]}...", fontsize=10)
+            self.show_tooltip(event.xdata, event.ydata, closest_node)
         else:
-            self.ax.set_title(f"{self.title}\n(VerbNet-FrameNet-WordNet Integration)", 
-                            fontsize=16, fontweight='bold')
-        
-        self.fig.canvas.draw_idle()
+            self.hide_tooltip()
+    
+    def _tooltip_text(self, node):
+        """Get the node description, shortened to TOOLTIP_MAX_CHARS."""
+        info = self.get_cached_node_info(node)
+        if len(info) > self.TOOLTIP_MAX_CHARS:
+            info = info[:self.TOOLTIP_MAX_CHARS] + "..."
+        return info
     
     def _on_click(self, event):
         """Handle mouse click events to select nodes."""
-        if event.inaxes != self.ax:
+        if event.inaxes is not self.ax:
             return
         
         # Find clicked node
-        clicked_node = None
-        min_dist = float('inf')
-        
-        for node, (x, y) in self.node_positions.items():
-            dist = ((event.xdata - x) ** 2 + (event.ydata - y) ** 2) ** 0.5
-            if dist < min_dist and dist < 0.1:
-                min_dist = dist
-                clicked_node = node
+        clicked_node = self._find_node_at(event.xdata, event.ydata)
         
         if clicked_node:
             self.selected_node = clicked_node
             print(f"\nSelected: {clicked_node}")
-            print(self.get_node_info(clicked_node))
+            print(self.get_cached_node_info(clicked_node))
             print("-" * 50)
             
             # Highlight selected node and its connections
             self._highlight_node(clicked_node)
     
+    def _hit_test_positions(self):
+        """Hit tests search the current layout."""
+        return self.node_positions
+    
+    def _reset_last_hover(self, ax=None):
+        """Forget the last hover position after the view limits change."""
+        # Positions recorded before the change no longer match the view
+        self._last_hover_xy = None
+    
+    def _find_node_at(self, x, y):
+        """Find the shown node nearest to (x, y) within PICK_RADIUS, or None."""
+        # Nodes the LOD pass shrank to nothing cannot be hovered or clicked
+        return self._nearest_node(x, y, self.PICK_RADIUS, hidden=self._pos_hidden)
+    
+    def _ensure_node_groups(self):
+        """Classify every node by corpus and label it, once until the graph changes."""
+        if self._node_groups_key != self._layout_key():
+            # Each name is split once into its corpus prefix and display label,
+            # filling the per-group node lists in the same pass
+            groups = {}
+            labels = {}
+            buckets = ([], [], [], [], [])
+            for n in self.G:
+                prefix, colon, name = n.partition(':')
+                group = groups[n] = _PREFIX_GROUPS.get(prefix + colon, _OTHER)
+                buckets[group].append(n)
+                labels[n] = name if colon else n
+            self._node_groups = groups
+            self._group_nodes = buckets
+            self._labels = labels
+            
+            # Every node in a group shares its corpus color, unless a subclass
+            # colors nodes individually
+            per_node_colors = (type(self).get_dag_node_color
+                               is not VerbNetFrameNetWordNetVisualizer.get_dag_node_color)
+            self._group_colors = [
+                to_rgba_array([self.get_dag_node_color(n) for n in nodes]) if per_node_colors
+                else np.tile(_GROUP_RGBA[group], (len(nodes), 1))
+                for group, nodes in enumerate(buckets)
+            ]
+            self._label_pos_source = None
+            self._node_groups_key = self._layout_key()
+    
+    def _get_label_layout(self):
+        """Get the label positions and texts, rebuilt only when the layout changes."""
+        self._ensure_node_groups()
+        self._ensure_pos_cache()
+        if self._label_pos_source is not self.node_positions:
+            groups = self._node_groups
+            codes = np.fromiter((groups.get(n, _OTHER) for n in self._pos_nodes),
+                                dtype=np.intp, count=len(self._pos_nodes))
+            label_xy = self._pos_xy + _LABEL_OFFSETS[codes]
+            self._label_pos = dict(zip(self._pos_nodes, map(tuple, label_xy.tolist())))
+            self._label_pos_source = self.node_positions
+        return self._label_pos, self._labels
+    
+    def _set_node_sizes(self, index, sizes):
+        """Resize one node collection, shrinking nodes hidden by the LOD pass to nothing."""
+        self._node_sizes[index] = sizes
+        visible = self._lod_visible
+        collection = self._node_collections[index][1]
+        collection.set_sizes(sizes if visible is None else sizes * visible[index])
+    
+    def _view_update_needed(self):
+        """Only graphs large enough for the LOD pass change with the view."""
+        return self._lod_visible is not None
+    
+    def _on_view_changed(self):
+        """Run the LOD pass for the new view limits."""
+        self._update_lod()
+    
+    def _update_lod(self, ax=None):
+        """Hide crowded nodes and thin out labels for the current view.
+        
+        The highlighted neighborhood is always shown with its labels.
+        """
+        if self._node_collections is None:
+            return
+        offsets = [collection.get_offsets() for _, collection, _ in self._node_collections]
+        if sum(map(len, offsets)) < self.LOD_NODE_THRESHOLD:
+            return
+        
+        # Keep the first node of each pixel cell, so earlier corpus groups win
+        points = np.concatenate(offsets)
+        cells = np.floor(self.ax.transData.transform(points) / self.LOD_PIXELS).astype(np.int64)
+        _, keep = np.unique(cells, axis=0, return_index=True)
+        visible = np.zeros(len(points), dtype=bool)
+        visible[keep] = True
+        
+        # Label shown nodes inside the view, unless too many are in view to read
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        xs = points[:, 0]
+        ys = points[:, 1]
+        labeled = visible & (x0 <= xs) & (xs <= x1) & (y0 <= ys) & (ys <= y1)
+        if np.count_nonzero(labeled) > self.VISIBLE_LABEL_LIMIT:
+            labeled[:] = False
+        
+        bounds = np.cumsum([len(o) for o in offsets])[:-1]
+        self._lod_visible = np.split(visible, bounds)
+        labeled = np.split(labeled, bounds)
+        if self._emphasized is not None:
+            for n in self._emphasized[0]:
+                index, i = self._node_slots[n]
+                self._lod_visible[index][i] = labeled[index][i] = True
+        
+        hidden = np.zeros(len(self._pos_nodes), dtype=bool)
+        hidden[self._slot_rows] = ~np.concatenate(self._lod_visible)
+        self._pos_hidden = hidden
+        
+        texts = self._label_texts
+        for index, (nodelist, _, _) in enumerate(self._node_collections):
+            self._set_node_sizes(index, self._node_sizes[index])
+            for n, shown in zip(nodelist, labeled[index]):
+                texts[n].set_visible(shown)
+    
+    def _build_adjacency(self):
+        """Precompute neighbor sets and incident edge lists for every node."""
+        self._preds = {n: frozenset(self.G.predecessors(n)) for n in self.G}
+        self._succs = {n: frozenset(self.G.successors(n)) for n in self.G}
+        
+        incident = {n: [] for n in self.G}
+        for source, target in self.G.edges():
+            incident[source].append((source, target))
+            if target != source:
+                incident[target].append((source, target))
+        self._incident = incident
+        self._adjacency_key = self._layout_key()
+    
+    def _ensure_neighbor_cache(self):
+        """Build the adjacency caches unless they already match the current graph."""
+        if self._adjacency_key != self._layout_key():
+            self._build_adjacency()
+    
     def _highlight_node(self, node):
         """Highlight a selected node and its connections."""
-        # Clear and redraw with highlighting
-        self.ax.clear()
+        self._ensure_neighbor_cache()
+        
+        # Restyle the persistent artists instead of clearing and redrawing
+        if self._node_collections is None:
+            self._draw_graph()
+        
+        # Selecting the highlighted node again changes no pixels
+        highlighted = (node, self._adjacency_key)
+        if self._emphasized is not None and self._highlighted == highlighted:
+            return
+        self._highlighted = highlighted
         
         # Get connected nodes
-        predecessors = set(self.G.predecessors(node))
-        successors = set(self.G.successors(node))
-        connected = predecessors | successors | {node}
-        
-        # Draw non-connected nodes with lower alpha
-        unconnected = set(self.G.nodes()) - connected
-        if unconnected:
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=list(unconnected),
-                                 node_color='lightgray',
-                                 node_size=1000,
-                                 alpha=0.3,
-                                 ax=self.ax)
+        connected = self._preds[node] | self._succs[node] | {node}
         
-        # Draw connected nodes with original colors
-        for n in connected:
-            color = self.get_dag_node_color(n)
-            size = 3500 if n == node else 2000
-            nx.draw_networkx_nodes(self.G, self.node_positions,
-                                 nodelist=[n],
-                                 node_color=color,
-                                 node_size=size,
-                                 alpha=1.0,
-                                 ax=self.ax)
+        # Edges inside the neighborhood, found from incident lists in
+        # O(deg) rather than by testing every edge in the graph
+        connected_edges = {
+            edge for n in connected for edge in self._incident[n]
+            if edge[0] in connected and edge[1] in connected
+        }
+        selected_edges = set(self._incident[node])
         
-        # Draw edges
-        for edge in self.G.edges():
-            if edge[0] in connected and edge[1] in connected:
-                nx.draw_networkx_edges(self.G, self.node_positions,
-                                     edgelist=[edge],
-                                     edge_color='red' if node in edge else 'black',
-                                     width=3 if node in edge else 1.5,
-                                     alpha=0.8,
-                                     arrows=True,
-                                     arrowsize=20,
-                                     ax=self.ax)
-            else:
-                nx.draw_networkx_edges(self.G, self.node_positions,
-                                     edgelist=[edge],
-                                     edge_color='lightgray',
-                                     width=0.5,
-                                     alpha=0.2,
-                                     arrows=True,
-                                     ax=self.ax)
-        
-        # Draw labels
-        labels = {}
-        for n in self.G.nodes():
-            if ':' in n:
-                labels[n] = n.split(':', 1)[1]
-            else:
-                labels[n] = n
+        # Connected nodes keep their corpus color at full opacity; the rest
+        # are greyed out. Alpha is carried per node in the RGBA colors.
+        greyed = to_rgba('lightgray', 0.3)
+        selected_slot = self._node_slots[node]
         
-        nx.draw_networkx_labels(self.G, self.node_positions,
-                              labels=labels,
-                              font_size=10 if node in connected else 6,
-                              font_weight='bold' if n == node else 'normal',
-                              ax=self.ax)
+        # Mark the neighborhood through its collection slots, touching
+        # O(deg) nodes instead of testing every node for membership
+        masks = [np.zeros(len(nodelist), dtype=bool) for nodelist, _, _ in self._node_collections]
+        for n in connected:
+            group, i = self._node_slots[n]
+            masks[group][i] = True
+        
+        # Groups without connected nodes now or at the previous highlight
+        # are already fully greyed out and keep their style
+        restyled = range(len(self._node_collections))
+        if self._emphasized is not None:
+            touched = connected | self._emphasized[0]
+            restyled = sorted({self._node_slots[n][0] for n in touched})
+        
+        for group in restyled:
+            nodelist, collection, base_colors = self._node_collections[group]
+            is_connected = masks[group]
+            colors = np.where(is_connected[:, None], base_colors, greyed)
+            sizes = np.where(is_connected, 2000.0, 1000.0)
+            if group == selected_slot[0]:
+                sizes[selected_slot[1]] = 3500
+            collection.set_alpha(None)
+            collection.set_facecolor(colors)
+            collection.set_edgecolor(colors)
+            self._set_node_sizes(group, sizes)
+        
+        # Once a highlight has greyed out the graph, only the previous and
+        # the new neighborhoods change style
+        if self._emphasized is None:
+            edges = self._edge_patches
+            label_nodes = self._label_texts
+        else:
+            previous_nodes, previous_edges = self._emphasized
+            edges = previous_edges | connected_edges if self._edge_patches else ()
+            label_nodes = previous_nodes | connected
+        self._emphasized = (connected, connected_edges)
+        
+        if self._edge_collection is not None:
+            # The fast edge collection is restyled with one array per property
+            edge_index = self._edge_index
+            color, width, _ = _EDGE_GREYED
+            colors = np.tile(color, (len(edge_index), 1))
+            widths = np.full(len(edge_index), width)
+            for edge_set, style in ((connected_edges, _EDGE_NEIGHBORHOOD),
+                                    (selected_edges, _EDGE_SELECTED)):
+                rows = [edge_index[edge] for edge in edge_set]
+                colors[rows], widths[rows], _ = style
+            self._edge_collection.set_color(colors)
+            self._edge_collection.set_linewidths(widths)
+        
+        # Grey out edges, darken the neighborhood and show the selected
+        # node's own edges in red
+        for edge in edges:
+            patch = self._edge_patches[edge]
+            if edge in selected_edges:
+                color, width, arrowsize = _EDGE_SELECTED
+            elif edge in connected_edges:
+                color, width, arrowsize = _EDGE_NEIGHBORHOOD
+            else:
+                color, width, arrowsize = _EDGE_GREYED
+            # The alpha is carried in the RGBA color
+            patch.set_alpha(None)
+            patch.set_color(color)
+            patch.set_linewidth(width)
+            patch.set_mutation_scale(arrowsize)
+        
+        # Labels: small and faded for greyed nodes, larger for the
+        # neighborhood and bold for the selected node itself
+        for n in label_nodes:
+            text = self._label_texts[n]
+            is_connected = n in connected
+            text.set_fontsize(10 if is_connected else 6)
+            text.set_fontweight('bold' if n == node else 'normal')
+            text.set_alpha(1.0 if is_connected else 0.5)
+        
+        # Large graphs show the new neighborhood even where the LOD pass
+        # hid it, and the previous one goes back to the view's detail
+        if self._lod_visible is not None:
+            self._update_lod()
         
         self.ax.set_title(f"{self.title} - Selected: {node}", 
                          fontsize=14, fontweight='bold')
-        self.ax.axis('off')
-        
-        # Re-add legend
-        legend_elements = self.create_dag_legend()
-        self.ax.legend(handles=legend_elements, loc='upper left', fontsize=10)
         
         self.fig.canvas.draw_idle()
     
@@ -5,30 +5,30 @@ This module contains the VerbNetVisualizer class for creating interactive
 VerbNet verb class hierarchy visualizations with specialized coloring and tooltips.
 """
 
+from matplotlib.patches import Patch
+
 from .InteractiveVisualizer import InteractiveVisualizer
 
+# Fill colors by VerbNet node type; other node types are light gray
+_NODE_TYPE_COLORS = {
+    'verb_class': 'lightblue',      # Top-level verb classes
+    'verb_subclass': 'lightgreen',  # Subclasses
+    'verb_member': 'lightyellow',   # Member verbs
+}
+
 
 class VerbNetVisualizer(InteractiveVisualizer):
     """Specialized visualizer for VerbNet verb class hierarchies."""
     
-    def __init__(self, G, hierarchy, title="VerbNet Verb Class Hierarchy"):
-        super().__init__(G, hierarchy, title)
+    def __init__(self, G, hierarchy, title="VerbNet Verb Class Hierarchy", layout_cache_dir=None):
+        super().__init__(G, hierarchy, title, layout_cache_dir)
     
     def get_dag_node_color(self, node):
         """Get color for a node based on VerbNet node type."""
-        node_data = self.G.nodes.get(node, {})
-        node_type = node_data.get('node_type', 'unknown')
-        
         if node == self.selected_node:
             return 'red'  # Highlight selected node
-        elif node_type == 'verb_class':
-            return 'lightblue'    # Top-level verb classes
-        elif node_type == 'verb_subclass':
-            return 'lightgreen'   # Subclasses
-        elif node_type == 'verb_member':
-            return 'lightyellow'  # Member verbs
-        else:
-            return 'lightgray'    # Unknown nodes
+        node_type = self.G.nodes.get(node, {}).get('node_type', 'unknown')
+        return _NODE_TYPE_COLORS.get(node_type, 'lightgray')
     
     def get_taxonomic_node_color(self, node):
         """Get color for a node based on depth in VerbNet hierarchy."""
@@ -153,7 +153,6 @@ class VerbNetVisualizer(InteractiveVisualizer):
     
     def create_dag_legend(self):
         """Create legend for VerbNet DAG visualization."""
-        from matplotlib.patches import Patch
         return [
             Patch(facecolor='lightblue', label='Verb Classes'),
             Patch(facecolor='lightgreen', label='Subclasses'),
@@ -163,7 +162,6 @@ class VerbNetVisualizer(InteractiveVisualizer):
     
     def create_taxonomic_legend(self):
         """Create legend for VerbNet taxonomic visualization."""
-        from matplotlib.patches import Patch
         return [
             Patch(facecolor='lightblue', label='Root Classes (Depth 0)'),
             Patch(facecolor='lightgreen', label='Subclasses (Depth 1)'),
@@ -6,22 +6,198 @@ for creating different types of semantic graph visualizations.
 """
 
 from collections import defaultdict
+import hashlib
+import json
+import math
 from pathlib import Path
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
 
-# Optional Plotly import for enhanced interactivity
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Optional Plotly for enhanced interactivity, imported on first use because it
+# is slow to import and only needed by create_plotly_visualization()
+PLOTLY_AVAILABLE = None
+go = None
+
+
+def _load_plotly():
+    """Import Plotly on first use and record whether it is available."""
+    global PLOTLY_AVAILABLE, go
+    if PLOTLY_AVAILABLE is None:
+        try:
+            import plotly.graph_objects as graph_objects
+            go = graph_objects
+            PLOTLY_AVAILABLE = True
+        except ImportError:
+            PLOTLY_AVAILABLE = False
+    return PLOTLY_AVAILABLE
+
+# Optional SciPy for the L-BFGS force-directed layout and the KD-tree overlap
+# search, imported on first use because only large graphs need it
+SCIPY_AVAILABLE = None
+sparse = None
+minimize = None
+cKDTree = None
+
+
+def _load_scipy():
+    """Import the SciPy modules on first use and record whether they are available."""
+    global SCIPY_AVAILABLE, sparse, minimize, cKDTree
+    if SCIPY_AVAILABLE is None:
+        try:
+            from scipy import sparse as scipy_sparse
+            from scipy.optimize import minimize as scipy_minimize
+            from scipy.spatial import cKDTree as scipy_kdtree
+            sparse, minimize, cKDTree = scipy_sparse, scipy_minimize, scipy_kdtree
+            SCIPY_AVAILABLE = True
+        except ImportError:
+            SCIPY_AVAILABLE = False
+    return SCIPY_AVAILABLE
+
+# Optional Numba for the compiled layout and hit-test kernels, imported and
+# compiled on first use by _load_numba(); until then the kernels are plain
+# Python
+NUMBA_AVAILABLE = None
+prange = range
+
+
+def _separation_displacement(points, min_distance):
+    """Sum the pushes that separate every pair of points closer than min_distance."""
+    n = points.shape[0]
+    min_distance_sq = min_distance * min_distance
+    displacement = np.zeros_like(points)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = points[j, 0] - points[i, 0]
+            dy = points[j, 1] - points[i, 1]
+            distance_sq = dx * dx + dy * dy
+            # Only the rare close pairs pay for the square root
+            if 0 < distance_sq < min_distance_sq:
+                distance = np.sqrt(distance_sq)
+                scale = (min_distance - distance) / (2 * distance)
+                displacement[i, 0] -= dx * scale
+                displacement[i, 1] -= dy * scale
+                displacement[j, 0] += dx * scale
+                displacement[j, 1] += dy * scale
+    return displacement
+
+
+def _repulsion_energy(points, k2):
+    """Log-repulsion energy of every pair of points and its gradient.
+    
+    Rows are summed independently, so memory stays O(N) instead of the
+    (N, N, 2) difference array of the NumPy formulation.
+    """
+    n = points.shape[0]
+    row_values = np.zeros(n)
+    grad = np.zeros_like(points)
+    for i in prange(n):
+        value = 0.0
+        gx = 0.0
+        gy = 0.0
+        for j in range(n):
+            if j != i:
+                dx = points[i, 0] - points[j, 0]
+                dy = points[i, 1] - points[j, 1]
+                dist_sq = dx * dx + dy * dy + 1e-9
+                value += math.log(dist_sq)
+                gx += dx / dist_sq
+                gy += dy / dist_sq
+        row_values[i] = value
+        grad[i, 0] = -k2 * gx
+        grad[i, 1] = -k2 * gy
+    return -0.25 * k2 * row_values.sum(), grad
+
+
+def _cutoff_repulsion_energy(points, k2, cutoff):
+    """Log-repulsion energy of the point pairs closer than cutoff, and its gradient.
+    
+    Pairs come from a KD-tree, so the cost follows the number of nearby
+    pairs instead of N^2. Each pair's energy is shifted to vanish at the
+    cutoff, keeping the total continuous as pairs enter and leave range.
+    """
+    n = points.shape[0]
+    pairs = cKDTree(points).query_pairs(cutoff, output_type='ndarray')
+    i, j = pairs[:, 0], pairs[:, 1]
+    diff = points[i] - points[j]
+    dist_sq = (diff * diff).sum(axis=1) + 1e-9
+    value = -0.5 * k2 * (np.log(dist_sq) - 2.0 * math.log(cutoff)).sum()
+    
+    force = k2 * diff / dist_sq[:, None]
+    grad = np.empty_like(points)
+    for axis in range(2):
+        grad[:, axis] = (np.bincount(j, force[:, axis], minlength=n)
+                         - np.bincount(i, force[:, axis], minlength=n))
+    return value, grad
+
+
+def _nearest_point(xy, x, y, max_d2):
+    """Return the index of the row of xy nearest to (x, y) and its squared distance.
+    
+    Rows at max_d2 or further are ignored; if none is closer, (-1, max_d2)
+    is returned.
+    """
+    best = -1
+    best_d2 = max_d2
+    for i in range(xy.shape[0]):
+        dx = xy[i, 0] - x
+        dy = xy[i, 1] - y
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2 = d2
+            best = i
+    return best, best_d2
+
+
+def _load_numba():
+    """Compile the kernels with Numba on first use and record whether it is available."""
+    global NUMBA_AVAILABLE, prange, _separation_displacement, _repulsion_energy, _nearest_point
+    if NUMBA_AVAILABLE is None:
+        try:
+            from numba import njit, prange as numba_prange
+        except ImportError:
+            NUMBA_AVAILABLE = False
+        else:
+            # Compiled on first call and cached on disk for later sessions
+            prange = numba_prange
+            _separation_displacement = njit(cache=True, fastmath=True)(_separation_displacement)
+            _repulsion_energy = njit(cache=True, fastmath=True, parallel=True)(_repulsion_energy)
+            _nearest_point = njit(cache=True, fastmath=True)(_nearest_point)
+            NUMBA_AVAILABLE = True
+    return NUMBA_AVAILABLE
 
 
 class Visualizer:
     """Base class for semantic graph visualizations."""
     
-    def __init__(self, G, hierarchy, title="Semantic Graph"):
+    # Above this many nodes (and with SciPy installed) the spring layout is
+    # computed by minimizing a force-directed energy with L-BFGS instead of
+    # running NetworkX's iterative Fruchterman-Reingold solver
+    LBFGS_LAYOUT_THRESHOLD = 200
+    
+    # Spring layout iterations refining the spectral initial placement
+    SPRING_REFINE_ITERATIONS = 50
+    
+    # From this many nodes the L-BFGS layout only repels node pairs closer
+    # than LAYOUT_REPULSION_CUTOFF times the spring constant, found with a
+    # KD-tree, instead of every pair
+    CUTOFF_REPULSION_THRESHOLD = 3000
+    LAYOUT_REPULSION_CUTOFF = 3.0
+    
+    # From this many nodes (and with SciPy installed) overlapping pairs are
+    # found with a KD-tree instead of checking every pair
+    KDTREE_SEPARATION_THRESHOLD = 256
+    
+    # From this many nodes (and with SciPy installed) hit tests query a
+    # KD-tree instead of scanning every node position
+    KDTREE_NODE_THRESHOLD = 2000
+    
+    # From this many nodes (and with Numba installed) the linear hit-test
+    # scan runs in a compiled kernel; smaller graphs skip its compilation
+    NUMBA_NODE_THRESHOLD = 500
+    
+    def __init__(self, G, hierarchy, title="Semantic Graph", layout_cache_dir=None):
         """
         Initialize the visualizer.
         
@@ -29,44 +205,213 @@ class Visualizer:
             G: NetworkX DiGraph
             hierarchy: Hierarchy data (frame/synset structure)
             title: Title for visualizations
+            layout_cache_dir: Optional directory in which computed layouts are
+                stored and reused across sessions; delete a cache file to
+                force a fresh layout
         """
         self.G = G
         self.hierarchy = hierarchy
         self.title = title
-        
+        self.layout_cache_dir = layout_cache_dir
+        self._dag_layout_key = None
+        self._node_order = None
+        self._pos_array = None
+        self._taxo_pos_cache = None
+        self._degree_cache_key = None
+        self._in_deg = None
+        self._out_deg = None
+        self._info_cache = {}
+        self._info_cache_source = None
+        self._pos_source = None
+        self._pos_nodes = []
+        self._pos_xy = np.empty((0, 2))
+        self._pos_kdtree = None
+        self._pos_bounds = (np.inf, np.inf, -np.inf, -np.inf)
+    
+    def _layout_key(self):
+        """Get a key that changes whenever the graph is replaced or resized."""
+        return (id(self.G), self.G.number_of_nodes(), self.G.number_of_edges())
+    
     def create_dag_layout(self):
-        """Create spring-based DAG layout for the graph."""
-        # Use NetworkX spring layout as base, but with DAG-aware enhancements
-        pos = nx.spring_layout(self.G, k=2.5, iterations=100, seed=42)
+        """Create spring-based DAG layout for the graph.
+        
+        The layout is computed once and reused until the graph changes;
+        callers receive their own position dict built from _pos_array.
+        """
+        self._ensure_dag_layout()
+        return {node: (x, y) for node, (x, y) in zip(self._node_order, self._pos_array.tolist())}
+    
+    def _ensure_dag_layout(self):
+        """Compute the DAG layout unless the cached one matches the current graph.
+        
+        Positions are kept as an (N, 2) float array in _pos_array, row i
+        holding the position of _node_order[i].
+        """
+        key = self._layout_key()
+        if self._dag_layout_key == key:
+            return
+        
+        self._node_order = list(self.G.nodes())
+        self._pos_array = self._compute_dag_layout(self._node_order)
+        self._dag_layout_key = key
+    
+    def _compute_dag_layout(self, nodes):
+        """Compute the spring-based DAG layout from scratch as an (N, 2) array."""
+        # Use a spring layout as base, but with DAG-aware enhancements
+        if len(nodes) > self.LBFGS_LAYOUT_THRESHOLD and _load_scipy():
+            points = self._lbfgs_spring_layout(k=2.5, seed=42)
+        else:
+            # Laplacian eigenvectors place the corpus clusters apart up
+            # front, so the spring refinement needs fewer iterations than
+            # from a random start. Disconnected graphs keep the random start:
+            # the spectral seed collapses each component onto one point,
+            # which the spring forces cannot pull apart.
+            undirected = self.G.to_undirected(as_view=True)
+            if len(nodes) > 2 and nx.is_connected(undirected):
+                initial = nx.spectral_layout(undirected)
+                pos = nx.spring_layout(self.G, pos=initial, k=2.5,
+                                       iterations=self.SPRING_REFINE_ITERATIONS, seed=42)
+            else:
+                pos = nx.spring_layout(self.G, k=2.5, iterations=100, seed=42)
+            points = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2)
         
         # Apply vertical bias based on topological ordering for DAG structure
         try:
             topo_order = list(nx.topological_sort(self.G))
+        except (nx.NetworkXError, nx.NetworkXUnfeasible):
+            # If not a DAG (shouldn't happen), use pure spring layout
+            topo_order = []
+        
+        if len(topo_order) > 1:
             topo_positions = {node: i for i, node in enumerate(topo_order)}
+            topo_index = np.fromiter((topo_positions[node] for node in nodes),
+                                     dtype=np.float64, count=len(nodes))
             
-            # Adjust Y coordinates to respect topological ordering while keeping spring positions
+            # Adjust Y coordinates to respect topological ordering while keeping
+            # spring positions: topological rank maps to a y range from 1 to -1
             max_topo = len(topo_order) - 1
-            for node in pos:
-                if node in topo_positions:
-                    # Blend spring layout with topological ordering
-                    spring_y = pos[node][1]
-                    topo_y = 1.0 - (2.0 * topo_positions[node] / max_topo)  # Range from 1 to -1
-                    
-                    # Weight: 60% topological order, 40% spring layout
-                    blended_y = 0.6 * topo_y + 0.4 * spring_y
-                    pos[node] = (pos[node][0], blended_y)
-        
-        except nx.NetworkXError:
-            # If not a DAG (shouldn't happen), use pure spring layout
-            pass
+            topo_y = 1.0 - 2.0 * topo_index / max_topo
+            
+            # Weight: 60% topological order, 40% spring layout
+            points[:, 1] = 0.6 * topo_y + 0.4 * points[:, 1]
         
         # Apply some spacing adjustments to avoid overlaps
-        self._adjust_positions_for_clarity(pos)
+        self._separate_points(points)
+        
+        return points
+    
+    def _lbfgs_spring_layout(self, k, seed, maxiter=50):
+        """Compute a force-directed layout by minimizing its energy with L-BFGS.
+        
+        Edges attract with energy |xi - xj|^2, every node pair repels with
+        -k^2 log|xi - xj|, and a weak pull towards the origin keeps
+        disconnected components together. Returns an (N, 2) array in graph
+        node order, rescaled to [-1, 1] like nx.spring_layout. Callers load
+        SciPy first with _load_scipy().
+        """
+        nodes = list(self.G.nodes())
+        n = len(nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = np.array(
+            [(index[u], index[v]) for u, v in self.G.edges() if u != v], dtype=np.intp
+        ).reshape(-1, 2)
+        
+        # The attraction energy sum |xi - xj|^2 over edges equals the
+        # quadratic form of the graph Laplacian, so energy and gradient
+        # take one sparse product per evaluation
+        adjacency = sparse.coo_matrix(
+            (np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(n, n)
+        ).tocsr()
+        adjacency = adjacency + adjacency.T
+        laplacian = (sparse.diags(np.asarray(adjacency.sum(axis=1)).ravel()) - adjacency).tocsr()
+        k2 = k * k
+        gravity = k2 / n
+        cutoff = self.LAYOUT_REPULSION_CUTOFF * k
+        use_cutoff = n >= self.CUTOFF_REPULSION_THRESHOLD
+        
+        def energy(flat):
+            x = flat.reshape(n, 2)
+            grad = 2.0 * gravity * x
+            value = gravity * (x * x).sum()
+            
+            # Attraction along edges
+            pull = laplacian @ x
+            value += (x * pull).sum()
+            grad += 2.0 * pull
+            
+            # Large graphs only repel nearby pairs; otherwise all pairs repel,
+            # in compiled parallel loops when Numba is available (the
+            # diagonal contributes nothing)
+            if use_cutoff:
+                repulsion, repulsion_grad = _cutoff_repulsion_energy(x, k2, cutoff)
+                return value + repulsion, (grad + repulsion_grad).ravel()
+            if _load_numba():
+                repulsion, repulsion_grad = _repulsion_energy(x, k2)
+                return value + repulsion, (grad + repulsion_grad).ravel()
+            diff = x[:, None, :] - x[None, :, :]
+            dist_sq = (diff * diff).sum(axis=-1) + 1e-9
+            np.fill_diagonal(dist_sq, 1.0)
+            value -= 0.25 * k2 * np.log(dist_sq).sum()
+            grad -= k2 * (diff / dist_sq[..., None]).sum(axis=1)
+            return value, grad.ravel()
+        
+        start = np.random.default_rng(seed).standard_normal((n, 2))
+        if use_cutoff:
+            # Spread the start so nodes are about k apart; otherwise every
+            # pair would begin inside the cutoff
+            start *= 0.5 * k * math.sqrt(n)
+        result = minimize(energy, start.ravel(), jac=True, method='L-BFGS-B',
+                          options={'maxiter': maxiter})
+        return nx.rescale_layout(result.x.reshape(n, 2))
+    
+    def _layout_cache_path(self):
+        """Get the layout cache file for the current graph structure."""
+        nodes = sorted(str(node) for node in self.G.nodes())
+        edges = sorted((str(u), str(v)) for u, v in self.G.edges())
+        key = hashlib.blake2b(
+            repr((type(self).__name__, nodes, edges)).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        return Path(self.layout_cache_dir) / f".uvi_layout_{key}.json"
+    
+    def load_or_create_layout(self):
+        """Load the DAG layout from the layout cache, computing it on a miss."""
+        if self.layout_cache_dir is None:
+            return self.create_dag_layout()
+        
+        cache_path = self._layout_cache_path()
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            by_name = {str(node): node for node in self.G.nodes()}
+            # Any payload other than a node -> [x, y] mapping fails to
+            # unpack or convert and is treated like a corrupt file
+            if isinstance(cached, dict) and set(cached) == set(by_name):
+                return {by_name[name]: (float(x), float(y)) for name, (x, y) in cached.items()}
+        except (OSError, ValueError, TypeError):
+            pass  # Missing or corrupt cache; recompute below
+        
+        pos = self.create_dag_layout()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({str(node): [float(x), float(y)] for node, (x, y) in pos.items()}, f)
+        except OSError as e:
+            print(f"Warning: Could not write layout cache {cache_path}: {e}")
         
         return pos
     
     def create_taxonomic_layout(self):
-        """Create hierarchical layout based on depth levels."""
+        """Create hierarchical layout based on depth levels.
+        
+        Like create_dag_layout(), the result is cached until the graph changes.
+        """
+        key = self._layout_key()
+        if self._taxo_pos_cache is None or self._taxo_pos_cache[0] != key:
+            self._taxo_pos_cache = (key, self._compute_taxonomic_layout())
+        return dict(self._taxo_pos_cache[1])
+    
+    def _compute_taxonomic_layout(self):
+        """Compute the depth-based hierarchical layout from scratch."""
         # Group nodes by depth levels for hierarchical layout
         depth_nodes = defaultdict(list)
         for node, data in self.G.nodes(data=True):
@@ -95,37 +440,158 @@ class Visualizer:
     def _adjust_positions_for_clarity(self, pos):
         """Adjust positions to improve clarity and reduce overlaps."""
         nodes = list(pos.keys())
-        min_distance = 0.3  # Minimum distance between nodes
-        
-        # Simple separation adjustment
-        for i, node1 in enumerate(nodes):
-            for j, node2 in enumerate(nodes[i+1:], i+1):
-                x1, y1 = pos[node1]
-                x2, y2 = pos[node2]
-                
-                distance = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-                if distance < min_distance and distance > 0:
-                    # Push nodes apart
-                    dx = (x2 - x1) / distance
-                    dy = (y2 - y1) / distance
-                    
-                    adjustment = (min_distance - distance) / 2
-                    pos[node1] = (x1 - dx * adjustment, y1 - dy * adjustment)
-                    pos[node2] = (x2 + dx * adjustment, y2 + dy * adjustment)
+        points = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2)
+        self._separate_points(points)
+        for node, (x, y) in zip(nodes, points.tolist()):
+            pos[node] = (x, y)
+    
+    def _separate_points(self, points, min_distance=0.3):
+        """Push apart rows of an (N, 2) position array closer than min_distance, in place."""
+        n = len(points)
+        if n < 2:
+            return
+        
+        # Push every pair closer than min_distance apart by half the overlap
+        # each, summing the pushes on a node
+        if n >= self.KDTREE_SEPARATION_THRESHOLD and _load_scipy():
+            # Only the (typically few) close pairs are enumerated
+            pairs = cKDTree(points).query_pairs(min_distance, output_type='ndarray')
+            first, second = pairs[:, 0], pairs[:, 1]
+            diff = points[second] - points[first]
+            distance = np.sqrt((diff ** 2).sum(axis=-1))
+            apart = distance > 0
+            first, second, diff, distance = first[apart], second[apart], diff[apart], distance[apart]
+            push = diff * ((min_distance - distance) / (2 * distance))[:, None]
+            displacement = np.zeros_like(points)
+            np.add.at(displacement, first, -push)
+            np.add.at(displacement, second, push)
+            points += displacement
+        elif _load_numba():
+            points += _separation_displacement(points, min_distance)
+        else:
+            # Pairwise differences are broadcast a block of rows at a time
+            # to bound memory on large graphs
+            displacement = np.zeros_like(points)
+            min_distance_sq = min_distance * min_distance
+            block = max(1, 2**20 // n)
+            for start in range(0, n, block):
+                diff = points[start:start + block, None, :] - points[None, :, :]
+                distance_sq = (diff ** 2).sum(axis=-1)
+                close = (distance_sq < min_distance_sq) & (distance_sq > 0)
+                # Square roots are taken only for the close pairs
+                distance = np.sqrt(distance_sq[close])
+                scale = np.zeros_like(distance_sq)
+                scale[close] = (min_distance - distance) / (2 * distance)
+                displacement[start:start + block] = (diff * scale[..., None]).sum(axis=1)
+            points += displacement
+    
+    def _hit_test_positions(self):
+        """Get the node -> (x, y) layout searched by hit tests, or None."""
+        return None
+    
+    def _ensure_pos_cache(self):
+        """Rebuild the (N, 2) position array whenever the layout is replaced."""
+        positions = self._hit_test_positions()
+        if self._pos_source is positions:
+            return
+        
+        # (N, 2) position array converted once, shared by drawing and hit tests
+        pos = positions or {}
+        self._pos_nodes = list(pos)
+        self._pos_xy = np.array(list(pos.values()), dtype=float).reshape(-1, 2)
+        if len(self._pos_xy):
+            xmin, ymin = self._pos_xy.min(axis=0)
+            xmax, ymax = self._pos_xy.max(axis=0)
+            self._pos_bounds = (xmin, ymin, xmax, ymax)
+        else:
+            self._pos_bounds = (np.inf, np.inf, -np.inf, -np.inf)
+        if len(self._pos_xy) >= self.KDTREE_NODE_THRESHOLD and _load_scipy():
+            self._pos_kdtree = cKDTree(self._pos_xy)
+        else:
+            self._pos_kdtree = None
+        self._pos_source = positions
+    
+    def _nearest_node(self, x, y, radius, hidden=None):
+        """Find the node nearest to (x, y) closer than radius, or None.
+        
+        Rows of the position cache flagged in the boolean array hidden
+        cannot be hit.
+        """
+        self._ensure_pos_cache()
+        
+        # Nothing can be hit outside the node bounding box grown by the radius
+        xmin, ymin, xmax, ymax = self._pos_bounds
+        if not (xmin - radius <= x <= xmax + radius
+                and ymin - radius <= y <= ymax + radius):
+            return None
+        
+        # Compare squared distances; the square root never changes the ordering
+        max_dist_sq = radius * radius
+        if hidden is not None:
+            index, dist_sq = self._nearest_shown(x, y, radius, hidden)
+        elif self._pos_kdtree is not None:
+            # Misses come back as index n with an infinite distance
+            dist, index = self._pos_kdtree.query((x, y), distance_upper_bound=radius)
+            if index == len(self._pos_nodes):
+                return None
+            dist_sq = dist * dist
+        else:
+            index, dist_sq = self._scan_nearest(x, y, max_dist_sq)
+        
+        return self._pos_nodes[index] if dist_sq < max_dist_sq else None
+    
+    def _nearest_shown(self, x, y, radius, hidden):
+        """Index of the nearest position not flagged in hidden and its squared distance."""
+        if self._pos_kdtree is not None:
+            # Every node within the radius, so hidden ones can be passed over
+            rows = np.array(self._pos_kdtree.query_ball_point((x, y), radius), dtype=np.intp)
+        else:
+            rows = np.arange(len(self._pos_nodes))
+        rows = rows[~hidden[rows]]
+        if not len(rows):
+            return -1, np.inf
+        
+        diff = self._pos_xy[rows] - (x, y)
+        dists_sq = (diff * diff).sum(axis=1)
+        best = int(dists_sq.argmin())
+        return rows[best], dists_sq[best]
+    
+    def _scan_nearest(self, x, y, max_dist_sq):
+        """Index of the cached position nearest to (x, y) and its squared distance."""
+        if len(self._pos_nodes) >= self.NUMBA_NODE_THRESHOLD and _load_numba():
+            return _nearest_point(self._pos_xy, x, y, max_dist_sq)
+        
+        # One vectorized pass over the cached position array
+        dx = self._pos_xy[:, 0] - x
+        dy = self._pos_xy[:, 1] - y
+        dists_sq = dx * dx + dy * dy
+        index = int(dists_sq.argmin())
+        return index, dists_sq[index]
     
     def get_dag_node_color(self, node):
-        """Get color for a node based on DAG properties and node type.
+        """Get color for a node based on DAG properties.
         
         This is a base implementation that should be overridden by subclasses
         for specialized coloring schemes.
         """
-        # Check if node has type information
-        node_data = self.G.nodes.get(node, {})
-        node_type = node_data.get('node_type', 'default')
-        
         # Basic DAG-based coloring
-        in_degree = self.G.in_degree(node)
-        out_degree = self.G.out_degree(node)
+        return self._degree_color(node)
+    
+    def _ensure_degree_cache(self):
+        """Precompute in/out degrees for every node until the graph changes."""
+        key = self._layout_key()
+        if self._degree_cache_key == key:
+            return
+        
+        self._in_deg = dict(self.G.in_degree())
+        self._out_deg = dict(self.G.out_degree())
+        self._degree_cache_key = key
+    
+    def _degree_color(self, node):
+        """Get the DAG color for a node from its cached in/out degrees."""
+        self._ensure_degree_cache()
+        in_degree = self._in_deg.get(node, 0)
+        out_degree = self._out_deg.get(node, 0)
         
         if in_degree == 0 and out_degree > 0:
             return 'lightblue'    # Source nodes (no parents)
@@ -136,6 +602,25 @@ class Visualizer:
         else:
             return 'lightgray'    # Isolated nodes
     
+    def _dag_node_colors(self, nodes):
+        """Get DAG colors for a list of nodes in one vectorized pass."""
+        # Subclasses with their own coloring scheme are colored node by node
+        if type(self).get_dag_node_color is not Visualizer.get_dag_node_color:
+            return [self.get_dag_node_color(node) for node in nodes]
+        
+        self._ensure_degree_cache()
+        count = len(nodes)
+        in_degree = np.fromiter((self._in_deg.get(node, 0) for node in nodes), dtype=np.intp, count=count)
+        out_degree = np.fromiter((self._out_deg.get(node, 0) for node in nodes), dtype=np.intp, count=count)
+        
+        has_parents = in_degree > 0
+        has_children = out_degree > 0
+        return np.select(
+            [~has_parents & has_children, has_parents & ~has_children, has_parents & has_children],
+            ['lightblue', 'lightcoral', 'lightgreen'],
+            default='lightgray'
+        ).tolist()
+    
     def get_taxonomic_node_color(self, node):
         """Get color for a node based on taxonomic depth."""
         depth = self.G.nodes[node].get('depth', 0)
@@ -154,36 +639,69 @@ class Visualizer:
         This is a base implementation that should be overridden by subclasses
         for specialized information display.
         """
-        if node not in self.hierarchy:
+        data = self.hierarchy.get(node)
+        if data is None:
             return f"Node: {node}\nNo additional information available."
         
-        data = self.hierarchy[node]
-        info = [f"Node: {node}"]
-        info.append(f"Depth: {data.get('depth', 'Unknown')}")
+        get = data.get
+        parents = get('parents')
+        children = get('children')
+        info = [f"Node: {node}", f"Depth: {get('depth', 'Unknown')}"]
         
-        parents = data.get('parents', [])
         if parents:
-            if len(parents) <= 3:
-                info.append(f"Parents: {', '.join(parents)}")
-            else:
-                info.append(f"Parents: {len(parents)} parent nodes")
+            info.append(f"Parents: {', '.join(parents)}" if len(parents) <= 3
+                        else f"Parents: {len(parents)} parent nodes")
         
-        children = data.get('children', [])
         if children:
-            if len(children) <= 3:
-                info.append(f"Children: {', '.join(children)}")
-            else:
-                info.append(f"Children: {len(children)} child nodes")
+            info.append(f"Children: {', '.join(children)}" if len(children) <= 3
+                        else f"Children: {len(children)} child nodes")
         
         return '\n'.join(info)
     
+    def get_cached_node_info(self, node):
+        """Get get_node_info(node), formatting each node's text only once.
+        
+        The cache is discarded when self.hierarchy is replaced; call
+        invalidate_node_info after modifying it in place.
+        """
+        self._ensure_info_cache()
+        info = self._info_cache.get(node)
+        if info is None:
+            info = self._info_cache[node] = self.get_node_info(node)
+        return info
+    
+    def precompute_node_info(self):
+        """Format the info of every graph node in one pass, ahead of interaction."""
+        self._ensure_info_cache()
+        cache = self._info_cache
+        get_node_info = self.get_node_info
+        for node in self.G:
+            if node not in cache:
+                cache[node] = get_node_info(node)
+    
+    def _ensure_info_cache(self):
+        """Discard cached node info if self.hierarchy has been replaced."""
+        if self._info_cache_source is not self.hierarchy:
+            self._info_cache = {}
+            self._info_cache_source = self.hierarchy
+    
+    def invalidate_node_info(self, node=None):
+        """Discard cached node info after self.hierarchy is modified in place.
+        
+        Args:
+            node: The node whose entry changed, or None to discard every entry
+        """
+        if node is None:
+            self._info_cache.clear()
+        else:
+            self._info_cache.pop(node, None)
+    
     def create_dag_legend(self):
         """Create legend elements for DAG visualization.
         
         This is a base implementation that should be overridden by subclasses
         for specialized legends.
         """
-        from matplotlib.patches import Patch
         return [
             Patch(facecolor='lightblue', label='Source Nodes (no parents)'),
             Patch(facecolor='lightgreen', label='Intermediate Nodes'),
@@ -193,7 +711,6 @@ class Visualizer:
     
     def create_taxonomic_legend(self):
         """Create legend elements for taxonomic visualization."""
-        from matplotlib.patches import Patch
         return [
             Patch(facecolor='lightblue', label='Root Nodes (Depth 0)'),
             Patch(facecolor='lightgreen', label='Level 1 Nodes'),
@@ -209,7 +726,7 @@ class Visualizer:
         pos = self.create_dag_layout()
         
         # Get node colors for DAG
-        node_colors = [self.get_dag_node_color(node) for node in self.G.nodes()]
+        node_colors = self._dag_node_colors(list(self.G.nodes()))
         
         # Draw graph
         nx.draw_networkx_nodes(self.G, pos, node_color=node_colors, node_size=2000, alpha=0.9)
@@ -262,44 +779,32 @@ class Visualizer:
     
     def create_plotly_visualization(self, save_path=None, show=True):
         """Create an interactive Plotly visualization."""
-        if not PLOTLY_AVAILABLE:
+        if not _load_plotly():
             print("Warning: Plotly not available, falling back to static visualization")
             return self.create_static_dag_visualization(save_path)
         
         # Create DAG layout
         pos = self.create_dag_layout()
         
-        # Prepare node data
-        node_x = []
-        node_y = []
-        node_text = []
-        node_color = []
-        hover_text = []
-        
-        for node in self.G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(node)
-            
-            # Color by DAG properties
-            node_color.append(self.get_dag_node_color(node))
-            
-            # Create hover text using get_node_info
-            node_info = self.get_node_info(node)
-            # Convert to HTML format for Plotly
-            hover_info = node_info.replace('\n', '<br>')
-            hover_text.append(hover_info)
-        
-        # Prepare edge data
-        edge_x = []
-        edge_y = []
-        
-        for edge in self.G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        # Prepare node data as arrays in graph node order
+        nodes = list(self.G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        points = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+        
+        # Color by DAG properties
+        node_color = self._dag_node_colors(nodes)
+        
+        # Hover text from get_node_info, converted to HTML line breaks
+        hover_text = [self.get_cached_node_info(node).replace('\n', '<br>') for node in nodes]
+        
+        # Prepare edge data: one (x0, x1, NaN) triple per edge, where the NaN
+        # breaks the line between consecutive edges
+        edges = np.array(
+            [(index[u], index[v]) for u, v in self.G.edges()], dtype=np.intp
+        ).reshape(-1, 2)
+        gaps = np.full(len(edges), np.nan)
+        edge_x = np.column_stack([points[edges[:, 0], 0], points[edges[:, 1], 0], gaps]).ravel()
+        edge_y = np.column_stack([points[edges[:, 0], 1], points[edges[:, 1], 1], gaps]).ravel()
         
         # Create plotly figure
         fig = go.Figure()
@@ -310,20 +815,21 @@ class Visualizer:
             line=dict(width=2, color='gray'),
             hoverinfo='none',
             mode='lines',
+            connectgaps=False,
             name='Relations',
             showlegend=False
         ))
         
         # Add nodes
         fig.add_trace(go.Scatter(
-            x=node_x, y=node_y,
+            x=points[:, 0], y=points[:, 1],
             mode='markers+text',
             marker=dict(
                 size=20,
                 color=node_color,
                 line=dict(width=2, color='black')
             ),
-            text=node_text,
+            text=nodes,
             textposition="middle center",
             textfont=dict(size=10, color='black'),
             hovertemplate='%{hovertext}<extra></extra>',
@@ -5,14 +5,16 @@ This module contains the WordNetVisualizer class for creating interactive
 WordNet semantic graph visualizations with specialized coloring and tooltips.
 """
 
+from matplotlib.patches import Patch
+
 from .InteractiveVisualizer import InteractiveVisualizer
 
 
 class WordNetVisualizer(InteractiveVisualizer):
     """Specialized visualizer for WordNet semantic graphs."""
     
-    def __init__(self, G, hierarchy, title="WordNet Semantic Graph"):
-        super().__init__(G, hierarchy, title)
+    def __init__(self, G, hierarchy, title="WordNet Semantic Graph", layout_cache_dir=None):
+        super().__init__(G, hierarchy, title, layout_cache_dir)
     
     def get_dag_node_color(self, node):
         """Get color for a node based on type."""
@@ -33,44 +35,46 @@ class WordNetVisualizer(InteractiveVisualizer):
         
         data = self.hierarchy[node]
         synset_info = data.get('synset_info', {})
-        node_type = synset_info.get('node_type', 'synset')
+        get = synset_info.get
+        depth = data.get('depth', 'Unknown')
         
-        if node_type == 'category':
-            info = [f"WordNet Category: {node}"]
-            info.append(f"Synset ID: {synset_info.get('synset_id', 'Unknown')}")
-            info.append(f"Depth: {data.get('depth', 'Unknown')}")
-            
+        # A definition stored as None counts as missing
+        definition = get('definition') or ''
+        if len(definition) > 80:
+            definition = definition[:77] + "..."
+        definition_line = f"Definition: {definition}" if definition else None
+        
+        # Fixed lines come from one template; optional lines are None when absent
+        if get('node_type', 'synset') == 'category':
             children = data.get('children', [])
-            if children:
-                if len(children) <= 3:
-                    info.append(f"Children: {', '.join(children)}")
-                else:
-                    info.append(f"Children: {', '.join(children[:3])}")
-                    info.append(f"  ... and {len(children)-3} more")
+            if not children:
+                children_line = None
+            elif len(children) <= 3:
+                children_line = f"Children: {', '.join(children)}"
+            else:
+                children_line = f"Children: {', '.join(children[:3])}\n  ... and {len(children)-3} more"
             
-            definition = synset_info.get('definition', '')
-            if definition:
-                if len(definition) > 80:
-                    definition = definition[:77] + "..."
-                info.append(f"Definition: {definition}")
+            parts = (
+                f"WordNet Category: {node}\n"
+                f"Synset ID: {get('synset_id', 'Unknown')}\n"
+                f"Depth: {depth}",
+                children_line,
+                definition_line,
+            )
         else:
             # Synset node
-            info = [f"WordNet Synset: {node}"]
-            info.append(f"Synset ID: {synset_info.get('synset_id', 'Unknown')}")
-            info.append(f"Parent: {synset_info.get('parent_category', 'Unknown')}")
-            info.append(f"Depth: {data.get('depth', 'Unknown')}")
-            
-            definition = synset_info.get('definition', '')
-            if definition:
-                if len(definition) > 80:
-                    definition = definition[:77] + "..."
-                info.append(f"Definition: {definition}")
+            parts = (
+                f"WordNet Synset: {node}\n"
+                f"Synset ID: {get('synset_id', 'Unknown')}\n"
+                f"Parent: {get('parent_category', 'Unknown')}\n"
+                f"Depth: {depth}",
+                definition_line,
+            )
         
-        return '\n'.join(info)
+        return '\n'.join(filter(None, parts))
     
     def create_dag_legend(self):
         """Create legend for WordNet visualization."""
-        from matplotlib.patches import Patch
         return [
             Patch(facecolor='lightblue', label='WordNet Categories'),
             Patch(facecolor='lightgreen', label='WordNet Synsets'),
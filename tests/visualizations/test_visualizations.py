@@ -5,9 +5,14 @@ This module contains comprehensive tests for the FrameNetVisualizer base class
 and InteractiveFrameNetGraph class to ensure proper functionality.
 """
 
+import json
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import networkx as nx
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_hex
 from collections import defaultdict
 
 # Import the visualization classes
@@ -15,7 +20,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from uvi.visualizations import FrameNetVisualizer, InteractiveFrameNetGraph
+from uvi.visualizations import Visualizer, FrameNetVisualizer, InteractiveFrameNetGraph, WordNetVisualizer
+from uvi.visualizations.VerbNetFrameNetWordNetVisualizer import VerbNetFrameNetWordNetVisualizer
 
 
 class TestFrameNetVisualizer(unittest.TestCase):
@@ -91,6 +97,248 @@ class TestFrameNetVisualizer(unittest.TestCase):
             self.assertIn(node, pos)
             self.assertEqual(len(pos[node]), 2)  # x, y coordinates
     
+    def test_create_dag_layout_cached_until_graph_changes(self):
+        """Test that the DAG layout is reused until nodes or edges change."""
+        with patch('networkx.spring_layout', wraps=nx.spring_layout) as mock_spring:
+            first = self.visualizer.create_dag_layout()
+            second = self.visualizer.create_dag_layout()
+            self.assertEqual(mock_spring.call_count, 1)
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+            
+            self.G.add_edge('Walking', 'Strolling')
+            pos = self.visualizer.create_dag_layout()
+            self.assertEqual(mock_spring.call_count, 2)
+            self.assertIn('Strolling', pos)
+    
+    def test_create_dag_layout_refines_spectral_placement(self):
+        """Test that the spring layout starts from the spectral layout."""
+        initial = nx.spectral_layout(self.G.to_undirected())
+        with patch('networkx.spectral_layout', return_value=initial) as mock_spectral, \
+                patch('networkx.spring_layout', wraps=nx.spring_layout) as mock_spring:
+            self.visualizer.create_dag_layout()
+        
+        mock_spectral.assert_called_once()
+        self.assertFalse(mock_spectral.call_args.args[0].is_directed())
+        kwargs = mock_spring.call_args.kwargs
+        self.assertIs(kwargs['pos'], initial)
+        self.assertEqual(kwargs['iterations'], self.visualizer.SPRING_REFINE_ITERATIONS)
+    
+    def test_create_dag_layout_separates_disconnected_components(self):
+        """Test that a forest of small trees is not collapsed per component."""
+        forest = nx.DiGraph()
+        for t in range(6):
+            root = f'root{t}'
+            forest.add_edges_from((root, f'{root}.{c}') for c in range(3))
+        visualizer = FrameNetVisualizer(forest, {})
+        
+        with patch('networkx.spectral_layout') as mock_spectral:
+            visualizer.create_dag_layout()
+            mock_spectral.assert_not_called()
+        
+        points = visualizer._pos_array
+        diff = points[:, None, :] - points[None, :, :]
+        dist = np.sqrt((diff * diff).sum(axis=-1))
+        np.fill_diagonal(dist, np.inf)
+        self.assertGreater(dist.min(), 0.1)
+        self.assertEqual(len(np.unique(points[:, 0].round(6))), len(forest))
+    
+    def test_create_dag_layout_backed_by_position_array(self):
+        """Test that the DAG layout dict is a view of the cached position array."""
+        pos = self.visualizer.create_dag_layout()
+        
+        self.assertEqual(self.visualizer._node_order, list(self.G.nodes()))
+        self.assertEqual(self.visualizer._pos_array.shape, (len(self.G), 2))
+        for node, row in zip(self.visualizer._node_order, self.visualizer._pos_array):
+            self.assertEqual(pos[node], tuple(row))
+    
+    def test_create_dag_layout_tolerates_cycles_and_single_nodes(self):
+        """Test that non-DAG and single-node graphs fall back to the spring layout."""
+        self.G.add_edge('Walking', 'Motion')
+        self.assertEqual(len(self.visualizer.create_dag_layout()), 4)
+        
+        single = FrameNetVisualizer(nx.DiGraph([('Motion', 'Motion')]), {})
+        self.assertEqual(list(single.create_dag_layout()), ['Motion'])
+    
+    def test_repulsion_energy_matches_dense_formula(self):
+        """Test the row-wise repulsion kernel against the all-pairs arrays."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        module._load_numba()
+        points = np.random.default_rng(3).standard_normal((40, 2))
+        
+        value, grad = module._repulsion_energy(points, 6.25)
+        
+        diff = points[:, None, :] - points[None, :, :]
+        dist_sq = (diff * diff).sum(axis=-1) + 1e-9
+        np.fill_diagonal(dist_sq, 1.0)
+        self.assertAlmostEqual(value, -0.25 * 6.25 * np.log(dist_sq).sum(), places=6)
+        np.testing.assert_allclose(grad, -6.25 * (diff / dist_sq[..., None]).sum(axis=1),
+                                   rtol=1e-9, atol=1e-9)
+    
+    def test_cutoff_repulsion_matches_dense_formula_within_cutoff(self):
+        """Test KD-tree cutoff repulsion against explicit sums over close pairs."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        points = np.random.default_rng(4).standard_normal((60, 2)) * 2.0
+        cutoff = 1.5
+        
+        value, grad = module._cutoff_repulsion_energy(points, 6.25, cutoff)
+        
+        diff = points[:, None, :] - points[None, :, :]
+        dist_sq = (diff * diff).sum(axis=-1) + 1e-9
+        near = dist_sq - 1e-9 <= cutoff * cutoff
+        np.fill_diagonal(near, False)
+        expected = -0.25 * 6.25 * (np.log(dist_sq) - 2 * np.log(cutoff))[near].sum()
+        self.assertAlmostEqual(value, expected, places=6)
+        np.testing.assert_allclose(
+            grad, -6.25 * (np.where(near[..., None], diff, 0.0) / dist_sq[..., None]).sum(axis=1),
+            rtol=1e-9, atol=1e-9
+        )
+    
+    def test_create_dag_layout_lbfgs_for_large_graphs(self):
+        """Test that graphs above the threshold use the L-BFGS spring layout."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        
+        self.visualizer.LBFGS_LAYOUT_THRESHOLD = 0
+        with patch('networkx.spring_layout') as mock_spring:
+            pos = self.visualizer.create_dag_layout()
+            mock_spring.assert_not_called()
+        
+        self.assertEqual(set(pos), set(self.G.nodes()))
+        for x, y in pos.values():
+            self.assertLessEqual(abs(x), 1.0 + 1e-9)
+            self.assertLessEqual(abs(y), 1.0 + 1e-9)
+        
+        # Very large graphs switch to the cutoff repulsion
+        self.visualizer.CUTOFF_REPULSION_THRESHOLD = 0
+        self.G.add_edge('Motion', 'Strolling')
+        module = sys.modules['uvi.visualizations.Visualizer']
+        with patch.object(module, '_cutoff_repulsion_energy',
+                          wraps=module._cutoff_repulsion_energy) as mock_cutoff:
+            pos = self.visualizer.create_dag_layout()
+            mock_cutoff.assert_called()
+        self.assertIn('Strolling', pos)
+    
+    def test_scipy_not_imported_until_needed(self):
+        """Test that the layout falls back to NetworkX when SciPy cannot be imported."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        blocked = {name: None for name in ('scipy', 'scipy.sparse', 'scipy.optimize', 'scipy.spatial')}
+        self.visualizer.LBFGS_LAYOUT_THRESHOLD = 0
+        with patch.object(module, 'SCIPY_AVAILABLE', None), patch.dict(sys.modules, blocked), \
+                patch.object(self.visualizer, '_lbfgs_spring_layout') as mock_lbfgs:
+            pos = self.visualizer.create_dag_layout()
+            mock_lbfgs.assert_not_called()
+            self.assertIs(module.SCIPY_AVAILABLE, False)
+        
+        self.assertEqual(set(pos), set(self.G.nodes()))
+    
+    def test_lbfgs_energy_gradient_matches_edge_sums(self):
+        """Test the Laplacian attraction term against explicit per-edge sums."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        
+        captured = []
+        def capture(energy, x0, **kwargs):
+            captured.append(energy)
+            return Mock(x=x0)
+        
+        with patch.object(module, 'minimize', side_effect=capture), \
+                patch.object(module, 'NUMBA_AVAILABLE', False):
+            self.visualizer._lbfgs_spring_layout(k=0.0, seed=0)
+        
+        # With k = 0 only the edge attraction remains
+        nodes = list(self.G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        x = np.random.default_rng(1).standard_normal((len(nodes), 2))
+        value, grad = captured[0](x.ravel())
+        
+        expected_grad = np.zeros_like(x)
+        expected_value = 0.0
+        for u, v in self.G.edges():
+            diff = x[index[u]] - x[index[v]]
+            expected_value += (diff * diff).sum()
+            expected_grad[index[u]] += 2.0 * diff
+            expected_grad[index[v]] -= 2.0 * diff
+        self.assertAlmostEqual(value, expected_value)
+        np.testing.assert_allclose(grad, expected_grad.ravel(), atol=1e-12)
+    
+    def test_create_plotly_visualization_edge_arrays(self):
+        """Test that edges are sent to Plotly as NaN-separated coordinate arrays."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_plotly():
+            self.skipTest("Plotly not available")
+        
+        pos = {node: (float(i), float(-i)) for i, node in enumerate(self.G.nodes())}
+        with patch.object(self.visualizer, 'create_dag_layout', return_value=pos):
+            fig = self.visualizer.create_plotly_visualization(show=False)
+        
+        edge_trace = fig.data[0]
+        expected_x = []
+        for u, v in self.G.edges():
+            expected_x.extend([pos[u][0], pos[v][0], np.nan])
+        np.testing.assert_array_equal(edge_trace.x, expected_x)
+        self.assertEqual(len(edge_trace.y), 3 * self.G.number_of_edges())
+        
+        node_trace = fig.data[1]
+        np.testing.assert_array_equal(node_trace.y, [pos[node][1] for node in self.G.nodes()])
+        self.assertEqual(list(node_trace.text), list(self.G.nodes()))
+        self.assertNotIn('\n', node_trace.hovertext[0])
+    
+    def test_plotly_not_imported_until_needed(self):
+        """Test that Plotly falls back to the static view when it cannot be imported."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        with patch.object(module, 'PLOTLY_AVAILABLE', None), \
+             patch.dict(sys.modules, {'plotly': None, 'plotly.graph_objects': None}), \
+             patch.object(self.visualizer, 'create_static_dag_visualization') as mock_static, \
+             patch('builtins.print'):
+            self.visualizer.create_plotly_visualization(show=False)
+            mock_static.assert_called_once_with(None)
+            self.assertIs(module.PLOTLY_AVAILABLE, False)
+    
+    def test_adjust_positions_for_clarity(self):
+        """Test that overlapping nodes are pushed apart to the minimum distance."""
+        pos = {'Motion': (0.0, 0.0), 'Transportation': (0.1, 0.0), 'Walking': (5.0, 5.0)}
+        self.visualizer._adjust_positions_for_clarity(pos)
+        
+        self.assertAlmostEqual(pos['Motion'][0], -0.1)
+        self.assertAlmostEqual(pos['Transportation'][0], 0.2)
+        self.assertEqual(pos['Walking'], (5.0, 5.0))
+    
+    def test_adjust_positions_without_numba(self):
+        """Test that the NumPy fallback matches the compiled overlap kernel."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        rng = np.random.default_rng(0)
+        start = {i: tuple(xy) for i, xy in enumerate(rng.random((40, 2)))}
+        
+        expected = dict(start)
+        self.visualizer._adjust_positions_for_clarity(expected)
+        actual = dict(start)
+        with patch.object(module, 'NUMBA_AVAILABLE', False):
+            self.visualizer._adjust_positions_for_clarity(actual)
+        
+        for node in start:
+            np.testing.assert_allclose(actual[node], expected[node])
+    
+    def test_separate_points_with_kdtree(self):
+        """Test that the KD-tree overlap search matches the all-pairs adjustment."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        
+        points = np.random.default_rng(1).random((300, 2)) * 3
+        expected = points.copy()
+        with patch.object(module, 'SCIPY_AVAILABLE', False):
+            self.visualizer._separate_points(expected)
+        actual = points.copy()
+        self.visualizer._separate_points(actual)
+        
+        np.testing.assert_allclose(actual, expected)
+        self.assertFalse(np.allclose(actual, points))
+    
     def test_create_taxonomic_layout(self):
         """Test taxonomic layout creation."""
         pos = self.visualizer.create_taxonomic_layout()
@@ -121,6 +369,24 @@ class TestFrameNetVisualizer(unittest.TestCase):
         self.assertEqual(self.visualizer.get_dag_node_color('Vehicle_motion'), 'lightcoral')
         self.assertEqual(self.visualizer.get_dag_node_color('Walking'), 'lightcoral')
     
+    def test_get_dag_node_color_follows_graph_changes(self):
+        """Test that cached degrees are refreshed when the graph changes."""
+        self.assertEqual(self.visualizer.get_dag_node_color('Walking'), 'lightcoral')
+        
+        self.G.add_edge('Walking', 'Strolling')
+        self.assertEqual(self.visualizer.get_dag_node_color('Walking'), 'lightgreen')
+        self.assertEqual(self.visualizer.get_dag_node_color('Strolling'), 'lightcoral')
+    
+    def test_dag_node_colors_match_per_node_colors(self):
+        """Test that vectorized DAG coloring agrees with get_dag_node_color."""
+        self.G.add_node('Isolated')
+        nodes = list(self.G.nodes())
+        
+        for visualizer in (Visualizer(self.G, self.hierarchy), self.visualizer):
+            expected = [visualizer.get_dag_node_color(node) for node in nodes]
+            self.assertEqual(visualizer._dag_node_colors(nodes), expected)
+            self.assertIn('lightgray', expected)
+    
     def test_get_taxonomic_node_color(self):
         """Test taxonomic node coloring."""
         self.assertEqual(self.visualizer.get_taxonomic_node_color('Motion'), 'lightblue')  # depth 0
@@ -141,6 +407,152 @@ class TestFrameNetVisualizer(unittest.TestCase):
         self.assertIn('NonExistentFrame', info_missing)
         self.assertIn('No additional information available', info_missing)
     
+    def test_get_node_info_by_node_type(self):
+        """Test tooltips for lexical unit and frame element nodes."""
+        self.visualizer.hierarchy = {
+            'walk.v': {
+                'depth': 3,
+                'frame_info': {'node_type': 'lexical_unit', 'name': 'walk.v',
+                               'frame': 'Self_motion', 'pos': 'V', 'definition': 'move on foot'}
+            },
+            'Self_mover': {
+                'depth': 3,
+                'frame_info': {'node_type': 'frame_element', 'name': 'Self_mover',
+                               'frame': 'Self_motion', 'core_type': 'Core', 'id': 7,
+                               'definition': '   '}
+            }
+        }
+        
+        self.assertEqual(self.visualizer.get_node_info('walk.v'),
+                         "Lexical Unit: walk.v\nFrame: Self_motion\nDepth: 3\nPOS: V\n"
+                         "Definition: move on foot")
+        self.assertEqual(self.visualizer.get_node_info('Self_mover'),
+                         "Frame Element: Self_mover\nFrame: Self_motion\nDepth: 3\n"
+                         "Core Type: Core\nID: 7")
+        
+        interactive = InteractiveFrameNetGraph(self.G, self.visualizer.hierarchy)
+        self.assertEqual(interactive.get_node_info('walk.v'),
+                         self.visualizer.get_node_info('walk.v'))
+    
+    def test_get_node_info_shortens_long_definitions(self):
+        """Test that definitions are cut to the per-type limit with an ellipsis."""
+        self.visualizer.hierarchy = {
+            'Frame': {'depth': 0, 'frame_info': {'definition': 'f' * 81}},
+            'unit.v': {'depth': 1, 'frame_info': {'node_type': 'lexical_unit',
+                                                  'definition': 'u' * 101}}
+        }
+        
+        self.assertIn(f"Definition: {'f' * 77}...", self.visualizer.get_node_info('Frame'))
+        self.assertIn(f"Definition: {'u' * 97}...", self.visualizer.get_node_info('unit.v'))
+    
+    def test_get_node_info_shares_formatted_text(self):
+        """Test that entries with the same fields are formatted once across nodes."""
+        module = sys.modules['uvi.visualizations.FrameNetVisualizer']
+        module._frame_info_lines.cache_clear()
+        self.visualizer.hierarchy = {
+            'run.v': {'depth': 3, 'frame_info': {'node_type': 'lexical_unit', 'name': 'run.v',
+                                                 'frame': 'Self_motion', 'pos': 'V',
+                                                 'examples': ['She ran.']}},
+            'walk.v': {'depth': 3, 'frame_info': {'node_type': 'lexical_unit', 'name': 'walk.v',
+                                                  'frame': 'Self_motion', 'pos': 'V'}}
+        }
+        
+        self.assertEqual(self.visualizer.get_node_info('run.v'),
+                         "Lexical Unit: run.v\nFrame: Self_motion\nDepth: 3\nPOS: V")
+        self.assertEqual(self.visualizer.get_node_info('walk.v'),
+                         "Lexical Unit: walk.v\nFrame: Self_motion\nDepth: 3\nPOS: V")
+        other = FrameNetVisualizer(self.G, self.visualizer.hierarchy)
+        other.get_node_info('walk.v')
+        self.assertEqual(module._frame_info_lines.cache_info().hits, 2)
+        
+        # Unhashable field values skip the cache but format the same way
+        self.visualizer.hierarchy = {
+            'Listy': {'depth': 0, 'frame_info': {'node_type': 'frame_element', 'id': [7]}}
+        }
+        self.assertEqual(self.visualizer.get_node_info('Listy'),
+                         "Frame Element: Listy\nFrame: Unknown\nDepth: 0\n"
+                         "Core Type: Unknown\nID: [7]")
+        self.assertEqual(module._frame_info_lines.cache_info().misses, 1)
+    
+    def test_get_node_info_summarizes_many_relatives(self):
+        """Test that frames list three relatives and count the rest."""
+        self.visualizer.hierarchy = {
+            'Hub': {
+                'depth': 1,
+                'parents': ['A', 'B', 'C', 'D'],
+                'children': [f'C{i}' for i in range(10)],
+                'frame_info': {}
+            }
+        }
+        
+        self.assertEqual(self.visualizer.get_node_info('Hub'),
+                         "Frame: Hub\nDepth: 1\nParents: A, B, C ... and 1 more\n"
+                         "Children: C0, C1, C2 ... and 7 more")
+    
+    def test_get_node_info_truncates_long_tooltips(self):
+        """Test that overly long tooltips keep whole lines and add a notice."""
+        self.visualizer.hierarchy = {
+            'Busy': {
+                'depth': 1,
+                'parents': ['P' * 90, 'Q' * 90],
+                'children': ['C' * 90, 'D' * 90],
+                'frame_info': {}
+            }
+        }
+        
+        self.assertEqual(self.visualizer.get_node_info('Busy'),
+                         f"Frame: Busy\nDepth: 1\nParents: {'P' * 90}, {'Q' * 90}\n"
+                         "... (tooltip truncated)")
+    
+    def test_base_get_node_info(self):
+        """Test the generic node info of the base visualizer."""
+        visualizer = Visualizer(self.G, {
+            'Motion': {'depth': 0, 'children': ['A', 'B', 'C', 'D']},
+            'Walking': {'parents': ['Motion']}
+        })
+        
+        self.assertEqual(visualizer.get_node_info('Motion'),
+                         "Node: Motion\nDepth: 0\nChildren: 4 child nodes")
+        self.assertEqual(visualizer.get_node_info('Walking'),
+                         "Node: Walking\nDepth: Unknown\nParents: Motion")
+        self.assertIn('No additional information', visualizer.get_node_info('Unknown'))
+    
+    def test_get_cached_node_info(self):
+        """Test that node info is formatted once until the hierarchy is replaced."""
+        with patch.object(self.visualizer, 'get_node_info',
+                          wraps=self.visualizer.get_node_info) as mock_info:
+            first = self.visualizer.get_cached_node_info('Motion')
+            self.assertEqual(self.visualizer.get_cached_node_info('Motion'), first)
+            self.assertEqual(mock_info.call_count, 1)
+            
+            self.visualizer.hierarchy = {}
+            self.assertIn('No additional information', self.visualizer.get_cached_node_info('Motion'))
+            self.assertEqual(mock_info.call_count, 2)
+    
+    def test_precompute_node_info(self):
+        """Test that every node's info is formatted in one batch pass."""
+        self.visualizer.precompute_node_info()
+        self.assertEqual(set(self.visualizer._info_cache), set(self.G.nodes()))
+        
+        with patch.object(self.visualizer, 'get_node_info') as mock_info:
+            self.visualizer.get_cached_node_info('Motion')
+            self.visualizer.precompute_node_info()
+            mock_info.assert_not_called()
+    
+    def test_invalidate_node_info_after_mutation(self):
+        """Test that in-place hierarchy edits are picked up once invalidated."""
+        self.visualizer.get_cached_node_info('Motion')
+        self.visualizer.get_cached_node_info('Transportation')
+        self.visualizer.hierarchy['Motion']['depth'] = 5
+        self.assertIn('Depth: 0', self.visualizer.get_cached_node_info('Motion'))
+        
+        self.visualizer.invalidate_node_info('Motion')
+        self.assertIn('Depth: 5', self.visualizer.get_cached_node_info('Motion'))
+        self.assertIn('Transportation', self.visualizer._info_cache)
+        
+        self.visualizer.invalidate_node_info()
+        self.assertEqual(self.visualizer._info_cache, {})
+    
     def test_create_dag_legend(self):
         """Test DAG legend creation."""
         legend_elements = self.visualizer.create_dag_legend()
@@ -158,6 +570,16 @@ class TestFrameNetVisualizer(unittest.TestCase):
         ]
         self.assertEqual(labels, expected_labels)
     
+    def test_legend_patches_built_once(self):
+        """Test that legends share module-level patches but return fresh lists."""
+        first = self.visualizer.create_dag_legend()
+        second = self.visualizer.create_dag_legend()
+        self.assertIsNot(first, second)
+        self.assertTrue(all(a is b for a, b in zip(first, second)))
+        
+        first.append(None)
+        self.assertEqual(len(self.visualizer.create_dag_legend()), 6)
+    
     def test_create_taxonomic_legend(self):
         """Test taxonomic legend creation."""
         legend_elements = self.visualizer.create_taxonomic_legend()
@@ -237,6 +659,136 @@ class TestInteractiveFrameNetGraph(unittest.TestCase):
         self.assertIsNone(self.interactive_graph.ax)
         self.assertIsNone(self.interactive_graph.save_button)
     
+    def test_layout_cache_reused_across_instances(self):
+        """Test that layouts are persisted and reused from the cache directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = InteractiveFrameNetGraph(self.G, self.hierarchy, layout_cache_dir=cache_dir)
+            pos = first.load_or_create_layout()
+            self.assertEqual(len(list(Path(cache_dir).glob('.uvi_layout_*.json'))), 1)
+            
+            second = InteractiveFrameNetGraph(self.G, self.hierarchy, layout_cache_dir=cache_dir)
+            with patch.object(second, 'create_dag_layout') as mock_layout:
+                cached_pos = second.load_or_create_layout()
+                mock_layout.assert_not_called()
+            
+            for node in self.G.nodes():
+                self.assertAlmostEqual(cached_pos[node][0], pos[node][0])
+                self.assertAlmostEqual(cached_pos[node][1], pos[node][1])
+    
+    @patch('networkx.draw_networkx_edges')
+    def test_draw_graph_uses_line_collection_for_large_graphs(self, mock_edges):
+        """Test that edges above the threshold are drawn as one LineCollection."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = {'Motion': (0.0, 1.0), 'Transportation': (0.0, -1.0)}
+            self.interactive_graph.FAST_EDGE_THRESHOLD = 0
+            
+            self.interactive_graph.draw_graph()
+            
+            mock_edges.assert_not_called()
+            segments = self.interactive_graph._edge_collection.get_segments()
+            self.assertEqual(len(segments), 1)
+            self.assertEqual(segments[0].tolist(), [[0.0, 1.0], [0.0, -1.0]])
+        finally:
+            plt.close(fig)
+    
+    def test_save_png_draws_arrows_for_large_graphs(self):
+        """Test that exports of fast-edge graphs get arrows without disturbing the view."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = self.interactive_graph.create_dag_layout()
+            self.interactive_graph.FAST_EDGE_THRESHOLD = 0
+            self.interactive_graph.draw_graph()
+            fig.canvas.draw()
+            background = self.interactive_graph._background
+            
+            patches_during_save = []
+            def fake_savefig(*args, **kwargs):
+                patches_during_save.append(len(ax.patches))
+                fig.canvas.draw()  # a draw during export must not replace the background
+            
+            with patch.object(fig, 'savefig', side_effect=fake_savefig), \
+                 patch.object(fig.canvas, 'is_saving', return_value=True), \
+                 patch('builtins.print'):
+                self.interactive_graph.save_png()
+            
+            self.assertEqual(patches_during_save, [self.G.number_of_edges()])
+            self.assertEqual(len(ax.patches), 0)
+            self.assertTrue(self.interactive_graph._edge_collection.get_visible())
+            self.assertIs(self.interactive_graph._background, background)
+        finally:
+            plt.close(fig)
+    
+    def test_labels_follow_zoom_on_large_graphs(self):
+        """Test that large graphs only label nodes inside a zoomed-in view."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = {'Motion': (0.0, 1.0), 'Transportation': (0.0, -1.0)}
+            self.interactive_graph.LABEL_NODE_LIMIT = 1
+            self.interactive_graph.VISIBLE_LABEL_LIMIT = 1
+            
+            self.interactive_graph.draw_graph()
+            self.assertEqual(self.interactive_graph._label_artists, {})
+            
+            ax.set_xlim(-0.5, 0.5)
+            ax.set_ylim(0.5, 1.5)
+            self.assertEqual(set(self.interactive_graph._label_artists), {'Motion'})
+            
+            # A replaced layout is picked up through the position cache
+            self.interactive_graph.pos = {'Motion': (0.0, -1.0), 'Transportation': (0.0, 1.0)}
+            ax.set_xlim(-0.4, 0.4)
+            self.assertEqual(set(self.interactive_graph._label_artists), {'Transportation'})
+        finally:
+            plt.close(fig)
+    
+    def test_zoom_relabels_once(self):
+        """Test that setting both view limits queues a single label pass."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = {'Motion': (0.0, 1.0), 'Transportation': (0.0, -1.0)}
+            self.interactive_graph.LABEL_NODE_LIMIT = 1
+            self.interactive_graph.draw_graph()
+            self.interactive_graph._view_timer = self.interactive_graph._create_view_timer()
+            
+            with patch.object(self.interactive_graph, '_on_view_changed') as mock_labels, \
+                    patch.object(self.interactive_graph._view_timer, 'start') as mock_start:
+                ax.set_xlim(-0.5, 0.5)
+                ax.set_ylim(0.5, 1.5)
+                mock_labels.assert_not_called()
+                self.assertEqual(mock_start.call_count, 2)
+                
+                self.interactive_graph._flush_view_update()
+                mock_labels.assert_called_once_with()
+        finally:
+            plt.close(fig)
+    
+    def test_draw_graph_reuses_legend_handles(self):
+        """Test that legend handles are built once across redraws."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = self.interactive_graph.create_dag_layout()
+            
+            with patch.object(self.interactive_graph, 'create_dag_legend',
+                              wraps=self.interactive_graph.create_dag_legend) as mock_legend:
+                self.interactive_graph.draw_graph()
+                self.interactive_graph.draw_graph()
+                mock_legend.assert_called_once()
+            
+            labels = [text.get_text() for text in ax.get_legend().get_texts()]
+            self.assertEqual(labels[-1], 'Selected Node')
+        finally:
+            plt.close(fig)
+    
     def test_get_node_color_selected(self):
         """Test node color when selected."""
         # Test selected node
@@ -246,15 +798,97 @@ class TestInteractiveFrameNetGraph(unittest.TestCase):
         # Test non-selected node
         self.assertEqual(self.interactive_graph.get_node_color('Transportation'), 'lightcoral')  # sink node
     
+    def test_draw_graph_drops_stale_blit_background(self):
+        """Test that redrawing the graph never blits the previous background."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = self.interactive_graph.create_dag_layout()
+            self.interactive_graph._background = object()
+            
+            self.interactive_graph.draw_graph()
+            self.assertIsNone(self.interactive_graph._background)
+            
+            with patch.object(fig.canvas, 'draw_idle') as mock_draw_idle:
+                self.interactive_graph.show_tooltip(0.0, 0.0, 'Motion')
+                mock_draw_idle.assert_called_once()
+        finally:
+            plt.close(fig)
+    
+    def test_tooltip_drawn_without_blitting(self):
+        """Test that the tooltip is drawn by full redraws on canvases that cannot blit."""
+        fig, ax = plt.subplots()
+        self.addCleanup(plt.close, fig)
+        canvas = fig.canvas
+        with patch.object(type(canvas), 'supports_blit', False):
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = self.interactive_graph.create_dag_layout()
+            self.interactive_graph.draw_graph()
+            canvas.mpl_connect('draw_event', self.interactive_graph._on_draw)
+            canvas.draw()
+            before = bytes(canvas.buffer_rgba())
+            
+            x, y = self.interactive_graph.pos['Motion']
+            self.interactive_graph.show_tooltip(x, y, 'Motion')
+            canvas.draw()
+            self.assertNotEqual(bytes(canvas.buffer_rgba()), before)
+            
+            self.interactive_graph.hide_tooltip()
+            canvas.draw()
+            self.assertEqual(bytes(canvas.buffer_rgba()), before)
+        self.assertIsNone(self.interactive_graph._background)
+    
+    def test_selection_drawn_without_blitting(self):
+        """Test that the selection marker is drawn by full redraws on canvases that cannot blit."""
+        fig, ax = plt.subplots()
+        self.addCleanup(plt.close, fig)
+        canvas = fig.canvas
+        with patch.object(type(canvas), 'supports_blit', False), patch('builtins.print'):
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = self.interactive_graph.create_dag_layout()
+            self.interactive_graph.draw_graph()
+            canvas.mpl_connect('draw_event', self.interactive_graph._on_draw)
+            canvas.draw()
+            before = bytes(canvas.buffer_rgba())
+            
+            with patch.object(canvas, 'draw_idle', wraps=canvas.draw_idle) as mock_draw_idle:
+                self.interactive_graph.select_node('Motion')
+                mock_draw_idle.assert_called_once()
+            canvas.draw()
+            self.assertNotEqual(bytes(canvas.buffer_rgba()), before)
+        self.assertFalse(self.interactive_graph._selection_marker.get_animated())
+    
+    def test_restyle_nodes_updates_only_changed_entries(self):
+        """Test that selection changes restyle cached node arrays in place."""
+        self.interactive_graph._build_node_styles()
+        index = self.interactive_graph._node_index
+        other_color = self.interactive_graph._node_colors[index['Transportation']].copy()
+        
+        self.interactive_graph.selected_node = 'Motion'
+        self.interactive_graph._restyle_nodes(['Motion'])
+        
+        motion = index['Motion']
+        self.assertEqual(self.interactive_graph._node_sizes[motion], 3000)
+        self.assertEqual(tuple(self.interactive_graph._node_colors[motion]), (1.0, 0.0, 0.0, 1.0))
+        self.assertEqual(
+            tuple(self.interactive_graph._node_colors[index['Transportation']]), tuple(other_color)
+        )
+    
     def test_select_node(self):
         """Test node selection functionality."""
         with patch('builtins.print') as mock_print:
-            with patch.object(self.interactive_graph, 'draw_graph') as mock_draw:
+            with patch.object(self.interactive_graph, 'draw_graph') as mock_draw, \
+                    patch.object(self.interactive_graph, '_update_selection_overlay') as mock_overlay:
                 self.interactive_graph.select_node('Motion')
                 
                 self.assertEqual(self.interactive_graph.selected_node, 'Motion')
                 mock_print.assert_called()
-                mock_draw.assert_called_once()
+                # Selection only refreshes the overlay, never the whole graph
+                mock_overlay.assert_called_once()
+                mock_draw.assert_not_called()
     
     @patch('matplotlib.pyplot.subplots')
     def test_create_interactive_plot(self, mock_subplots):
@@ -275,8 +909,10 @@ class TestInteractiveFrameNetGraph(unittest.TestCase):
         self.assertEqual(self.interactive_graph.fig, mock_fig)
         self.assertEqual(self.interactive_graph.ax, mock_ax)
         
-        # Verify event connections were made
-        self.assertEqual(mock_canvas.mpl_connect.call_count, 2)
+        # Verify event connections were made (hover, click, the pan/zoom
+        # hover suspension pair and the draw event that refreshes the
+        # blitting background)
+        self.assertEqual(mock_canvas.mpl_connect.call_count, 5)
         
         self.assertEqual(result, mock_fig)
     
@@ -344,11 +980,979 @@ class TestInteractiveFrameNetGraph(unittest.TestCase):
         
         self.interactive_graph.hide_tooltip()
         
-        # Updated to check set_visible instead of remove since the implementation changed
+        # The annotation is hidden but kept for reuse by the next hover
         mock_annotation.set_visible.assert_called_once_with(False)
         mock_canvas.draw_idle.assert_called_once()
-        self.assertIsNone(self.interactive_graph.annotation)
+        self.assertIs(self.interactive_graph.annotation, mock_annotation)
+    
+    def test_find_closest_node(self):
+        """Test nearest-node lookup within the interaction threshold."""
+        self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (1.0, 0.0)}
+        
+        self.assertEqual(self.interactive_graph._find_closest_node(0.4, 0.0, 0.5), 'Motion')
+        self.assertEqual(self.interactive_graph._find_closest_node(0.6, 0.0, 0.5), 'Transportation')
+        self.assertIsNone(self.interactive_graph._find_closest_node(0.5, 0.6, 0.5))
+        self.assertIsNone(self.interactive_graph._find_closest_node(5.0, 5.0, 0.5))
+        
+        # Replacing the layout refreshes the cached bounds
+        self.interactive_graph.pos = {'Motion': (5.0, 5.0)}
+        self.assertEqual(self.interactive_graph._find_closest_node(5.0, 5.2, 0.5), 'Motion')
+    
+    def test_interaction_threshold_cached_until_zoom(self):
+        """Test that the interaction threshold is recomputed only after the view changes."""
+        fig, ax = plt.subplots()
+        try:
+            self.interactive_graph.fig = fig
+            self.interactive_graph.ax = ax
+            self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (1.0, 1.0)}
+            self.interactive_graph.draw_graph()
+            
+            ax.set_xlim(0.0, 2.0)
+            ax.set_ylim(0.0, 2.0)
+            self.assertAlmostEqual(self.interactive_graph._get_interaction_threshold(), 0.1)
+            
+            with patch.object(ax, 'get_xlim', wraps=ax.get_xlim) as mock_xlim:
+                self.interactive_graph._get_interaction_threshold()
+                mock_xlim.assert_not_called()
+            
+            ax.set_xlim(0.0, 1.0)
+            ax.set_ylim(0.0, 1.0)
+            self.assertAlmostEqual(self.interactive_graph._get_interaction_threshold(), 0.05)
+        finally:
+            plt.close(fig)
+    
+    def test_find_closest_node_without_numba(self):
+        """Test that the NumPy scan matches the compiled nearest-node kernel."""
+        self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (1.0, 0.0)}
+        points = [(0.4, 0.0), (0.6, 0.0), (0.5, 0.6), (0.9, 0.3)]
+        
+        with patch.object(self.interactive_graph, 'NUMBA_NODE_THRESHOLD', 1):
+            expected = [self.interactive_graph._find_closest_node(x, y, 0.5) for x, y in points]
+        module = sys.modules['uvi.visualizations.Visualizer']
+        with patch.object(module, 'NUMBA_AVAILABLE', False):
+            actual = [self.interactive_graph._find_closest_node(x, y, 0.5) for x, y in points]
+        
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual, ['Motion', 'Transportation', None, 'Transportation'])
+    
+    def test_numba_not_imported_until_needed(self):
+        """Test that hit testing falls back to NumPy when Numba cannot be imported."""
+        self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (1.0, 0.0)}
+        module = sys.modules['uvi.visualizations.Visualizer']
+        with patch.object(module, 'NUMBA_AVAILABLE', None), \
+                patch.dict(sys.modules, {'numba': None}), \
+                patch.object(self.interactive_graph, 'NUMBA_NODE_THRESHOLD', 1):
+            self.assertEqual(self.interactive_graph._find_closest_node(0.9, 0.3, 0.5), 'Transportation')
+            self.assertIs(module.NUMBA_AVAILABLE, False)
+    
+    def test_find_closest_node_with_kdtree(self):
+        """Test that the KD-tree lookup matches the linear scan."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        
+        self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (1.0, 0.0)}
+        points = [(0.4, 0.0), (0.6, 0.0), (0.5, 0.6), (0.9, 0.3)]
+        
+        with patch.object(self.interactive_graph, 'KDTREE_NODE_THRESHOLD', 1):
+            actual = [self.interactive_graph._find_closest_node(x, y, 0.5) for x, y in points]
+        
+        self.assertIsNotNone(self.interactive_graph._pos_kdtree)
+        self.assertEqual(actual, ['Motion', 'Transportation', None, 'Transportation'])
+    
+    def test_on_hover_skips_repeat_work_for_same_node(self):
+        """Test that hovering within the same node redraws the tooltip once."""
+        mock_ax = MagicMock()
+        mock_ax.get_xlim.return_value = (-1.0, 1.0)
+        mock_ax.get_ylim.return_value = (-1.0, 1.0)
+        self.interactive_graph.ax = mock_ax
+        self.interactive_graph.pos = {'Motion': (0.0, 0.0), 'Transportation': (0.8, 0.8)}
+        
+        def hover(x, y):
+            event = Mock(inaxes=mock_ax, xdata=x, ydata=y)
+            self.interactive_graph.on_hover(event)
+        
+        with patch.object(self.interactive_graph, 'show_tooltip') as mock_show:
+            hover(0.0, 0.0)
+            hover(0.001, 0.001)  # jitter inside the node
+            hover(0.05, 0.05)    # still the same node
+            self.assertEqual(mock_show.call_count, 1)
+            
+            hover(0.8, 0.8)
+            self.assertEqual(mock_show.call_count, 2)
+    
+    def test_on_hover_coalesces_events_until_timer_fires(self):
+        """Test that a burst of motion events is processed once per timer interval."""
+        mock_timer = MagicMock()
+        self.interactive_graph._hover_timer = mock_timer
+        events = [Mock(name=f'event{i}') for i in range(5)]
+        
+        with patch.object(self.interactive_graph, '_process_hover') as mock_process:
+            for event in events:
+                self.interactive_graph.on_hover(event)
+            mock_timer.start.assert_called_once()
+            mock_process.assert_not_called()
+            
+            self.interactive_graph._flush_hover()
+            mock_process.assert_called_once_with(events[-1])
+            
+            # Nothing pending: a spurious timeout does no work
+            self.interactive_graph._flush_hover()
+            mock_process.assert_called_once()
+    
+    def test_hover_suspended_during_toolbar_pan_zoom(self):
+        """Test that the hover handler is disconnected while panning or zooming."""
+        mock_canvas = MagicMock()
+        mock_canvas.mpl_connect.return_value = 7
+        self.interactive_graph.fig = MagicMock(canvas=mock_canvas)
+        self.interactive_graph._hover_cid = 3
+        
+        # Plain clicks leave hovering alone
+        mock_canvas.toolbar.mode = ''
+        self.interactive_graph._suspend_hover(Mock())
+        mock_canvas.mpl_disconnect.assert_not_called()
+        
+        mock_canvas.toolbar.mode = 'pan/zoom'
+        self.interactive_graph._suspend_hover(Mock())
+        mock_canvas.mpl_disconnect.assert_called_once_with(3)
+        self.assertIsNone(self.interactive_graph._hover_cid)
+        
+        self.interactive_graph._resume_hover(Mock())
+        mock_canvas.mpl_connect.assert_called_once_with(
+            'motion_notify_event', self.interactive_graph.on_hover
+        )
+        self.assertEqual(self.interactive_graph._hover_cid, 7)
+    
+    def test_hide_tooltip_skips_hidden_annotation(self):
+        """Test that hiding an already hidden tooltip does not redraw."""
+        mock_annotation = MagicMock()
+        mock_annotation.get_visible.return_value = False
+        mock_fig = MagicMock()
+        
+        self.interactive_graph.fig = mock_fig
+        self.interactive_graph.annotation = mock_annotation
+        
+        self.interactive_graph.hide_tooltip()
+        
+        mock_annotation.set_visible.assert_not_called()
+        mock_fig.canvas.draw_idle.assert_not_called()
+    
+    def test_show_tooltip_reuses_annotation(self):
+        """Test that repeated hovers mutate a single annotation artist."""
+        mock_ax = MagicMock()
+        self.interactive_graph.fig = MagicMock()
+        self.interactive_graph.ax = mock_ax
+        
+        self.interactive_graph.show_tooltip(0.0, 0.0, 'Motion')
+        self.interactive_graph.show_tooltip(1.0, 1.0, 'Transportation')
+        
+        mock_ax.annotate.assert_called_once()
+        annotation = self.interactive_graph.annotation
+        self.assertEqual(annotation.xy, (1.0, 1.0))
+        annotation.set_visible.assert_called_with(True)
+    
+    def test_show_tooltip_blits_cached_background(self):
+        """Test that tooltips are blitted once a background is cached."""
+        mock_fig = MagicMock()
+        mock_canvas = MagicMock()
+        mock_fig.canvas = mock_canvas
+        
+        self.interactive_graph.fig = mock_fig
+        self.interactive_graph.ax = MagicMock()
+        self.interactive_graph._background = 'cached-background'
+        
+        self.interactive_graph.show_tooltip(0.0, 0.0, 'Motion')
+        
+        mock_canvas.restore_region.assert_called_once_with('cached-background')
+        mock_canvas.blit.assert_called_once()
+        mock_canvas.draw_idle.assert_not_called()
 
 
+
+class TestWordNetVisualizer(unittest.TestCase):
+    """Test cases for WordNetVisualizer class."""
+    
+    def test_get_node_info(self):
+        """Test tooltips for category and synset nodes."""
+        hierarchy = {
+            'noun.motion': {
+                'depth': 0,
+                'children': ['run.n.01', 'walk.n.01', 'jog.n.01', 'dash.n.01'],
+                'synset_info': {'node_type': 'category', 'synset_id': 'motion'}
+            },
+            'run.n.01': {
+                'depth': 1,
+                'synset_info': {'synset_id': 'run.n.01', 'parent_category': 'noun.motion',
+                                'definition': 'r' * 90}
+            }
+        }
+        visualizer = WordNetVisualizer(nx.DiGraph(), hierarchy)
+        
+        self.assertEqual(visualizer.get_node_info('noun.motion'),
+                         "WordNet Category: noun.motion\nSynset ID: motion\nDepth: 0\n"
+                         "Children: run.n.01, walk.n.01, jog.n.01\n  ... and 1 more")
+        self.assertEqual(visualizer.get_node_info('run.n.01'),
+                         "WordNet Synset: run.n.01\nSynset ID: run.n.01\n"
+                         f"Parent: noun.motion\nDepth: 1\nDefinition: {'r' * 77}...")
+    
+    def test_get_node_info_without_definition(self):
+        """Test that a synset whose definition is None still gets a tooltip."""
+        hierarchy = {
+            'run.n.01': {
+                'depth': 1,
+                'synset_info': {'synset_id': 'run.n.01', 'parent_category': 'noun.motion',
+                                'definition': None}
+            }
+        }
+        visualizer = WordNetVisualizer(nx.DiGraph([('noun.motion', 'run.n.01')]), hierarchy)
+        
+        self.assertEqual(visualizer.get_node_info('run.n.01'),
+                         "WordNet Synset: run.n.01\nSynset ID: run.n.01\n"
+                         "Parent: noun.motion\nDepth: 1")
+        visualizer.precompute_node_info()
+        self.assertIn('run.n.01', visualizer._info_cache)
+
+
+class TestVerbNetFrameNetWordNetVisualizer(unittest.TestCase):
+    """Test cases for the integrated VerbNet-FrameNet-WordNet visualizer."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.G = nx.DiGraph()
+        self.G.add_edges_from([
+            ('VN:run-51.3.2', 'FN:Self_motion'),
+            ('VN:run-51.3.2', 'WN:run.v.01'),
+            ('FN:Self_motion', 'WN:run.v.01'),
+            ('VERB:run', 'VN:run-51.3.2'),
+            ('FN:Motion', 'FN:Self_motion'),
+            ('WN:travel.v.01', 'WN:run.v.01')
+        ])
+        
+        self.hierarchy = {
+            'VN:run-51.3.2': {
+                'parents': ['VERB:run'],
+                'children': ['FN:Self_motion', 'WN:run.v.01'],
+                'node_info': {
+                    'node_type': 'verbnet_class',
+                    'class_id': 'run-51.3.2',
+                    'members': ['run', 'jog'],
+                    'themroles': ['Agent', 'Theme']
+                }
+            },
+            'FN:Self_motion': {
+                'parents': ['VN:run-51.3.2', 'FN:Motion'],
+                'children': ['WN:run.v.01'],
+                'frame_info': {
+                    'node_type': 'framenet_frame',
+                    'frame_name': 'Self_motion',
+                    'definition': 'The Self_mover moves under its own power.',
+                    'lexical_units': 12
+                }
+            }
+        }
+        
+        self.visualizer = VerbNetFrameNetWordNetVisualizer(self.G, self.hierarchy, "Integrated Test")
+    
+    def test_layout_cache_regenerates_corrupt_files(self):
+        """Test that the integrated layout is cached on disk and rebuilt when unreadable."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = VerbNetFrameNetWordNetVisualizer(self.G, self.hierarchy, layout_cache_dir=cache_dir)
+            pos = first.load_or_create_layout()
+            cache_path = first._layout_cache_path()
+            self.assertTrue(cache_path.exists())
+            
+            second = VerbNetFrameNetWordNetVisualizer(self.G, self.hierarchy, layout_cache_dir=cache_dir)
+            with patch.object(second, 'create_dag_layout') as mock_layout:
+                self.assertEqual(set(second.load_or_create_layout()), set(pos))
+                mock_layout.assert_not_called()
+            
+            cache_path.write_text('{not json', encoding='utf-8')
+            with patch.object(second, 'create_dag_layout', return_value=pos) as mock_layout:
+                second.load_or_create_layout()
+                mock_layout.assert_called_once()
+            self.assertEqual(set(json.loads(cache_path.read_text(encoding='utf-8'))), set(pos))
+    
+    def test_layout_cache_regenerates_malformed_payloads(self):
+        """Test that valid JSON of the wrong shape is rebuilt instead of raising."""
+        names = [str(node) for node in self.G.nodes()]
+        payloads = [
+            names,
+            [[0.0, 0.0]] * len(names),
+            {name: 1.0 for name in names},
+            {name: [0.0, 0.0, 0.0] for name in names},
+            {name: 'xy' for name in names},
+            {name: None for name in names},
+        ]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            visualizer = VerbNetFrameNetWordNetVisualizer(self.G, self.hierarchy, layout_cache_dir=cache_dir)
+            pos = {node: (float(i), 0.0) for i, node in enumerate(self.G.nodes())}
+            cache_path = visualizer._layout_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for payload in payloads:
+                cache_path.write_text(json.dumps(payload), encoding='utf-8')
+                with patch.object(visualizer, 'create_dag_layout', return_value=pos) as mock_layout:
+                    self.assertEqual(visualizer.load_or_create_layout(), pos)
+                    mock_layout.assert_called_once()
+            
+            # The rewritten cache is read back as float pairs
+            with patch.object(visualizer, 'create_dag_layout') as mock_layout:
+                self.assertEqual(visualizer.load_or_create_layout(), pos)
+                mock_layout.assert_not_called()
+    
+    def test_get_dag_node_color_by_prefix(self):
+        """Test corpus colors looked up from the node prefix."""
+        colors = {n: self.visualizer.get_dag_node_color(n)
+                  for n in ['VN:run-51.3.2', 'FN:Motion', 'WN:run.v.01', 'VERB:run', 'VN', 'misc']}
+        self.assertEqual(colors, {
+            'VN:run-51.3.2': '#4A90E2',
+            'FN:Motion': '#7B68EE',
+            'WN:run.v.01': '#50C878',
+            'VERB:run': '#FFB84D',
+            'VN': 'lightgray',
+            'misc': 'lightgray'
+        })
+    
+    def test_get_node_info_by_node_type(self):
+        """Test node details formatted by each node type's builder."""
+        self.assertEqual(self.visualizer.get_node_info('FN:Self_motion'), '\n'.join([
+            "FrameNet Frame: FN:Self_motion",
+            "Frame: Self_motion",
+            "Definition: The Self_mover moves under its own power.",
+            "Lexical Units: 12",
+            "Connected from: VN:run-51.3.2, FN:Motion",
+            "Connected to: WN:run.v.01"
+        ]))
+        
+        self.hierarchy['WN:run.v.01'] = {'synset_info': {
+            'node_type': 'wordnet_synset',
+            'synset_id': 'run.v.01',
+            'words': ['run', 'go', 'pass', 'lead', 'extend', 'proceed'],
+            'definition': 'x' * 120
+        }}
+        self.assertEqual(self.visualizer.get_node_info('WN:run.v.01'), '\n'.join([
+            "WordNet Synset: WN:run.v.01",
+            "Synset ID: run.v.01",
+            "Words: run, go, pass... (6 total)",
+            f"Definition: {'x' * 97}..."
+        ]))
+        
+        self.hierarchy['VERB:run'] = {'verb_info': {'node_type': 'other'}}
+        self.assertEqual(self.visualizer.get_node_info('VERB:run'),
+                         Visualizer.get_node_info(self.visualizer, 'VERB:run'))
+    
+    def test_node_groups_cached_per_graph(self):
+        """Test that corpus groups are classified once per graph."""
+        self.visualizer._ensure_node_groups()
+        groups = self.visualizer._node_groups
+        self.assertEqual(groups['VN:run-51.3.2'], 0)
+        self.assertEqual(groups['FN:Motion'], 1)
+        self.assertEqual(groups['WN:travel.v.01'], 2)
+        self.assertEqual(groups['VERB:run'], 3)
+        
+        self.assertEqual(self.visualizer._group_nodes, (
+            ['VN:run-51.3.2'],
+            ['FN:Self_motion', 'FN:Motion'],
+            ['WN:run.v.01', 'WN:travel.v.01'],
+            ['VERB:run'],
+            []
+        ))
+        
+        self.visualizer._ensure_node_groups()
+        self.assertIs(self.visualizer._node_groups, groups)
+        
+        self.G.add_node('misc')
+        self.visualizer._ensure_node_groups()
+        self.assertEqual(self.visualizer._node_groups['misc'], 4)
+        self.assertEqual(self.visualizer._group_nodes[4], ['misc'])
+    
+    def test_display_names_strip_only_the_corpus_prefix(self):
+        """Test the precomputed short names for unusual node names."""
+        self.G.add_edges_from([('WN:entity:n', 'misc'), ('PB:run.01', 'VN:run-51.3.2')])
+        self.visualizer._ensure_node_groups()
+        labels = self.visualizer._labels
+        
+        self.assertEqual(labels['WN:entity:n'], 'entity:n')
+        self.assertEqual(labels['PB:run.01'], 'run.01')
+        self.assertEqual(labels['misc'], 'misc')
+        self.assertEqual(self.visualizer._node_groups['WN:entity:n'], 2)
+        self.assertEqual(self.visualizer._node_groups['PB:run.01'], 4)
+    
+    def test_labels_resolved_once_across_redraws(self):
+        """Test that node labels are split once per graph, not per draw or highlight."""
+        self._draw_real_graph()
+        labels = self.visualizer._labels
+        self.assertEqual(labels['WN:run.v.01'], 'run.v.01')
+        
+        self.visualizer._highlight_node('WN:run.v.01')
+        self.visualizer._draw_graph()
+        self.visualizer._highlight_node('VN:run-51.3.2')
+        self.assertIs(self.visualizer._labels, labels)
+        self.assertIs(self.visualizer._get_label_layout()[1], labels)
+        self.assertEqual(self.visualizer._label_texts['WN:run.v.01'].get_text(), 'run.v.01')
+        
+        # Replacing the graph resolves the labels again
+        self.G.add_node('WN:walk.v.01')
+        self.visualizer._ensure_node_groups()
+        self.assertIsNot(self.visualizer._labels, labels)
+        self.assertEqual(self.visualizer._labels['WN:walk.v.01'], 'walk.v.01')
+    
+    def test_build_adjacency(self):
+        """Test precomputed neighbor sets and incident edge lists."""
+        self.visualizer._build_adjacency()
+        
+        self.assertEqual(self.visualizer._preds['FN:Self_motion'],
+                         frozenset({'VN:run-51.3.2', 'FN:Motion'}))
+        self.assertEqual(self.visualizer._succs['VN:run-51.3.2'],
+                         frozenset({'FN:Self_motion', 'WN:run.v.01'}))
+        self.assertEqual(sorted(self.visualizer._incident['WN:run.v.01']), [
+            ('FN:Self_motion', 'WN:run.v.01'),
+            ('VN:run-51.3.2', 'WN:run.v.01'),
+            ('WN:travel.v.01', 'WN:run.v.01')
+        ])
+
+    
+    def test_neighbor_cache_rebuilt_only_on_graph_change(self):
+        """Test that adjacency caches persist until the graph changes."""
+        with patch.object(self.visualizer, '_build_adjacency',
+                          wraps=self.visualizer._build_adjacency) as mock_build:
+            self.visualizer._ensure_neighbor_cache()
+            self.visualizer._ensure_neighbor_cache()
+            self.assertEqual(mock_build.call_count, 1)
+            
+            self.G.add_edge('VERB:jog', 'VN:run-51.3.2')
+            self.visualizer._ensure_neighbor_cache()
+            self.assertEqual(mock_build.call_count, 2)
+        
+        self.assertIn('VERB:jog', self.visualizer._preds['VN:run-51.3.2'])
+    
+    def _draw_real_graph(self):
+        """Draw the fixture graph on a real figure and return the axes."""
+        self.visualizer.fig, self.visualizer.ax = plt.subplots()
+        self.addCleanup(plt.close, self.visualizer.fig)
+        self.visualizer.node_positions = {
+            node: (float(i), float(i)) for i, node in enumerate(self.G.nodes())
+        }
+        self.visualizer._draw_graph()
+        return self.visualizer.ax
+    
+    def test_label_layout_cached_per_layout(self):
+        """Test label offsets and texts, reused until the layout is replaced."""
+        self.visualizer.node_positions = {n: (1.0, 1.0) for n in self.G.nodes()}
+        label_pos, labels = self.visualizer._get_label_layout()
+        
+        self.assertEqual(label_pos['VN:run-51.3.2'], (1.0, 0.92))
+        self.assertEqual(label_pos['FN:Motion'], (1.0, 1.08))
+        self.assertEqual(label_pos['WN:run.v.01'], (1.08, 1.0))
+        self.assertEqual(label_pos['VERB:run'], (1.0, 1.0))
+        self.assertEqual(labels['WN:run.v.01'], 'run.v.01')
+        self.assertIs(self.visualizer._get_label_layout()[0], label_pos)
+        
+        self.visualizer.node_positions = {n: (0.0, 0.0) for n in self.G.nodes()}
+        self.assertEqual(self.visualizer._get_label_layout()[0]['FN:Motion'], (0.0, 0.08))
+    
+    def test_draw_graph_unknown_prefixes_fall_into_other_group(self):
+        """Test that unclassified nodes land in the last group exactly once."""
+        self.G.add_edge('PB:run.01', 'VN:run-51.3.2')
+        self.G.add_node('misc')
+        self._draw_real_graph()
+        
+        groups = [nodes for nodes, _, _ in self.visualizer._node_collections]
+        self.assertEqual(groups[-1], ['PB:run.01', 'misc'])
+        drawn = [n for nodes in groups for n in nodes]
+        self.assertEqual(sorted(drawn), sorted(self.G.nodes()))
+    
+    def test_draw_graph_honors_overridden_node_colors(self):
+        """Test that subclasses coloring nodes individually bypass the group table."""
+        class Custom(VerbNetFrameNetWordNetVisualizer):
+            def get_dag_node_color(self, node):
+                return 'black' if node == 'FN:Motion' else super().get_dag_node_color(node)
+        
+        self.visualizer = Custom(self.G, self.hierarchy)
+        self._draw_real_graph()
+        nodes, _, base_colors = self.visualizer._node_collections[1]
+        colors = {n: to_hex(c) for n, c in zip(nodes, base_colors)}
+        self.assertEqual(colors, {'FN:Self_motion': '#7b68ee', 'FN:Motion': '#000000'})
+        
+        # Per-node colors are looked up once per graph, not on every redraw
+        with patch.object(self.visualizer, 'get_dag_node_color') as mock_color:
+            self.visualizer._draw_graph()
+            mock_color.assert_not_called()
+    
+    def test_draw_graph_edge_styles(self):
+        """Test edge colors and widths chosen from relation type and corpora."""
+        self.G.edges['FN:Motion', 'FN:Self_motion']['relation_type'] = 'semantic_similarity'
+        self._draw_real_graph()
+        
+        styles = {
+            edge: (to_hex(arrow.get_edgecolor()), arrow.get_linewidth())
+            for edge, arrow in self.visualizer._edge_patches.items()
+        }
+        self.assertEqual(styles, {
+            ('VN:run-51.3.2', 'FN:Self_motion'): (to_hex('blue'), 2.0),
+            ('VN:run-51.3.2', 'WN:run.v.01'): (to_hex('green'), 2.0),
+            ('FN:Self_motion', 'WN:run.v.01'): (to_hex('purple'), 1.5),
+            ('VERB:run', 'VN:run-51.3.2'): (to_hex('gray'), 1.0),
+            ('FN:Motion', 'FN:Self_motion'): (to_hex('purple'), 1.5),
+            ('WN:travel.v.01', 'WN:run.v.01'): (to_hex('gray'), 1.0)
+        })
+        
+        dashes = {edge: arrow.get_linestyle() for edge, arrow in self.visualizer._edge_patches.items()}
+        self.assertEqual(dashes[('FN:Motion', 'FN:Self_motion')], ':')
+        self.assertEqual(dashes[('FN:Self_motion', 'WN:run.v.01')], '--')
+        self.assertEqual(dashes[('VN:run-51.3.2', 'FN:Self_motion')], 'solid')
+        
+        # The line styles survive highlighting
+        self.visualizer._highlight_node('FN:Motion')
+        self.assertEqual(self.visualizer._edge_patches[('FN:Motion', 'FN:Self_motion')].get_linestyle(), ':')
+    
+    def test_draw_graph_one_scatter_per_group(self):
+        """Test that each corpus group is drawn as one scatter collection."""
+        ax = self._draw_real_graph()
+        
+        groups = self.visualizer._node_collections
+        self.assertEqual(len(ax.collections), len(groups))
+        self.assertEqual([nodes for nodes, _, _ in groups], [
+            ['VN:run-51.3.2'],
+            ['FN:Self_motion', 'FN:Motion'],
+            ['WN:run.v.01', 'WN:travel.v.01'],
+            ['VERB:run']
+        ])
+        nodes, collection, _ = groups[1]
+        np.testing.assert_allclose(collection.get_offsets(),
+                                   [self.visualizer.node_positions[n] for n in nodes])
+        self.assertEqual(to_hex(collection.get_facecolor()[0]), '#7b68ee')
+    
+    def test_draw_graph_builds_node_and_label_artists_directly(self):
+        """Test that nodes and labels are created without the NetworkX draw wrappers."""
+        with patch.object(nx, 'draw_networkx_nodes') as mock_nodes, \
+                patch.object(nx, 'draw_networkx_labels') as mock_labels:
+            ax = self._draw_real_graph()
+        mock_nodes.assert_not_called()
+        mock_labels.assert_not_called()
+        
+        texts = self.visualizer._label_texts
+        self.assertEqual(set(texts), set(self.G.nodes()))
+        self.assertTrue(all(t in ax.texts for t in texts.values()))
+        label = texts['FN:Motion']
+        self.assertEqual((label.get_text(), label.get_ha(), label.get_va()),
+                         ('Motion', 'center', 'center'))
+        self.assertEqual(label.get_position(), self.visualizer._get_label_layout()[0]['FN:Motion'])
+    
+    def test_highlight_node_restyles_artists_in_place(self):
+        """Test that highlighting restyles the existing node and edge artists."""
+        ax = self._draw_real_graph()
+        collections = list(ax.collections)
+        patches = list(ax.patches)
+        
+        with patch.object(ax, 'clear') as mock_clear:
+            self.visualizer._highlight_node('VN:run-51.3.2')
+            mock_clear.assert_not_called()
+        self.assertEqual(list(ax.collections), collections)
+        self.assertEqual(list(ax.patches), patches)
+        
+        styles = {}
+        for nodelist, collection, _ in self.visualizer._node_collections:
+            for n, color, size in zip(nodelist, collection.get_facecolor(), collection.get_sizes()):
+                styles[n] = (color[3], size)
+        self.assertEqual(styles['VN:run-51.3.2'], (1.0, 3500))
+        self.assertEqual(styles['FN:Self_motion'], (1.0, 2000))
+        self.assertAlmostEqual(styles['FN:Motion'][0], 0.3)
+        self.assertEqual(styles['FN:Motion'][1], 1000)
+        
+        edge_colors = {
+            edge: to_hex(arrow.get_edgecolor())
+            for edge, arrow in self.visualizer._edge_patches.items()
+        }
+        self.assertEqual(edge_colors[('VERB:run', 'VN:run-51.3.2')], to_hex('red'))
+        self.assertEqual(edge_colors[('FN:Self_motion', 'WN:run.v.01')], to_hex('black'))
+        self.assertEqual(edge_colors[('FN:Motion', 'FN:Self_motion')], to_hex('lightgray'))
+        greyed = self.visualizer._edge_patches[('FN:Motion', 'FN:Self_motion')]
+        self.assertAlmostEqual(greyed.get_edgecolor()[3], 0.2)
+        self.assertEqual(greyed.get_mutation_scale(), 10)
+    
+    def _artist_styles(self):
+        """Collect the current edge and label styles of the drawn graph."""
+        edges = {
+            edge: (to_hex(arrow.get_edgecolor()), arrow.get_linewidth(), arrow.get_mutation_scale())
+            for edge, arrow in self.visualizer._edge_patches.items()
+        }
+        labels = {n: (t.get_fontsize(), t.get_fontweight(), t.get_alpha())
+                  for n, t in self.visualizer._label_texts.items()}
+        return edges, labels
+    
+    def test_rehighlight_restyles_only_changed_neighborhoods(self):
+        """Test that moving the selection matches highlighting from scratch."""
+        self._draw_real_graph()
+        self.visualizer._highlight_node('VN:run-51.3.2')
+        self.visualizer._highlight_node('FN:Motion')
+        moved = self._artist_styles()
+        
+        self._draw_real_graph()
+        self.visualizer._highlight_node('FN:Motion')
+        self.assertEqual(moved, self._artist_styles())
+        
+        with patch.object(self.visualizer._edge_patches[('WN:travel.v.01', 'WN:run.v.01')],
+                          'set_color') as mock_set_color:
+            self.visualizer._highlight_node('VERB:run')
+            mock_set_color.assert_not_called()
+    
+    def test_rehighlight_same_node_skips_redraw(self):
+        """Test that clicking the highlighted node again does no restyling or redraw."""
+        self._draw_real_graph()
+        self.visualizer._highlight_node('VN:run-51.3.2')
+        canvas = self.visualizer.fig.canvas
+        
+        with patch.object(canvas, 'draw_idle') as mock_draw_idle:
+            self.visualizer._highlight_node('VN:run-51.3.2')
+            mock_draw_idle.assert_not_called()
+            
+            # A redraw resets the styles, so the next highlight applies them
+            self.visualizer._draw_graph()
+            self.visualizer._highlight_node('VN:run-51.3.2')
+            mock_draw_idle.assert_called_once()
+    
+    def test_rehighlight_skips_untouched_node_groups(self):
+        """Test that groups greyed out before and after a move keep their style."""
+        self._draw_real_graph()
+        self.visualizer._highlight_node('FN:Motion')
+        collections = [c for _, c, _ in self.visualizer._node_collections]
+        
+        with patch.object(collections[0], 'set_facecolor') as mock_vn, \
+                patch.object(collections[3], 'set_facecolor') as mock_verb, \
+                patch.object(collections[1], 'set_facecolor') as mock_fn:
+            self.visualizer._highlight_node('WN:travel.v.01')
+        mock_vn.assert_not_called()
+        mock_verb.assert_not_called()
+        mock_fn.assert_called_once()
+        
+        sizes = dict(zip(self.visualizer._node_collections[2][0], collections[2].get_sizes()))
+        self.assertEqual(sizes, {'WN:run.v.01': 2000, 'WN:travel.v.01': 3500})
+    
+    def test_lod_hides_crowded_nodes_until_zoomed_in(self):
+        """Test that nodes overlapping on screen are hidden and return on zoom."""
+        self.visualizer.LOD_NODE_THRESHOLD = 0
+        self.visualizer.fig, ax = plt.subplots()
+        self.visualizer.ax = ax
+        self.addCleanup(plt.close, self.visualizer.fig)
+        self.visualizer.node_positions = {
+            node: (float(i), float(i)) for i, node in enumerate(self.G.nodes())
+        }
+        self.visualizer.node_positions['FN:Motion'] = (0.001, 0.0)
+        self.visualizer._draw_graph()
+        ax.callbacks.connect('xlim_changed', self.visualizer._schedule_view_update)
+        ax.callbacks.connect('ylim_changed', self.visualizer._schedule_view_update)
+        self.visualizer._update_lod()
+        
+        def shown(node):
+            index, i = self.visualizer._node_slots[node]
+            size = self.visualizer._node_collections[index][1].get_sizes()[i]
+            return size > 0, self.visualizer._label_texts[node].get_visible()
+        
+        self.assertEqual(shown('VN:run-51.3.2'), (True, True))
+        self.assertEqual(shown('FN:Motion'), (False, False))
+        
+        ax.set_xlim(-0.01, 0.01)
+        ax.set_ylim(-0.01, 0.01)
+        self.assertEqual(shown('FN:Motion'), (True, True))
+        
+        ax.set_xlim(-1, 6)
+        ax.set_ylim(-1, 6)
+        self.assertEqual(shown('FN:Motion'), (False, False))
+        self.visualizer._highlight_node('FN:Motion')
+        self.assertEqual(shown('FN:Motion'), (True, True))
+    
+    def test_find_node_at_skips_lod_hidden_nodes(self):
+        """Test that hover and click land on shown nodes, never on LOD-hidden ones."""
+        self.visualizer.LOD_NODE_THRESHOLD = 0
+        self.visualizer.fig, ax = plt.subplots()
+        self.visualizer.ax = ax
+        self.addCleanup(plt.close, self.visualizer.fig)
+        self.visualizer.node_positions = {
+            node: (float(i), float(i)) for i, node in enumerate(self.G.nodes())
+        }
+        self.visualizer.node_positions['FN:Motion'] = (0.02, 0.0)
+        self.visualizer._draw_graph()
+        self.assertEqual(self.visualizer._find_node_at(0.02, 0.0), 'FN:Motion')
+        
+        self.visualizer._update_lod()
+        self.assertEqual(self.visualizer._find_node_at(0.02, 0.0), 'VN:run-51.3.2')
+        if sys.modules['uvi.visualizations.Visualizer']._load_scipy():
+            with patch.object(self.visualizer, 'KDTREE_NODE_THRESHOLD', 1):
+                self.visualizer.node_positions = dict(self.visualizer.node_positions)
+                self.assertEqual(self.visualizer._find_node_at(0.02, 0.0), 'VN:run-51.3.2')
+                self.assertIsNotNone(self.visualizer._pos_kdtree)
+        
+        # Zoomed in far enough, the node is shown and can be picked again
+        ax.set_xlim(-0.05, 0.05)
+        ax.set_ylim(-0.05, 0.05)
+        self.visualizer._update_lod()
+        self.assertEqual(self.visualizer._find_node_at(0.02, 0.0), 'FN:Motion')
+    
+    def test_lod_runs_once_per_view_change(self):
+        """Test that setting both view limits queues a single LOD pass."""
+        self.visualizer.LOD_NODE_THRESHOLD = 0
+        ax = self._draw_real_graph()
+        ax.callbacks.connect('xlim_changed', self.visualizer._schedule_view_update)
+        ax.callbacks.connect('ylim_changed', self.visualizer._schedule_view_update)
+        self.visualizer._update_lod()
+        mock_timer = Mock()
+        self.visualizer._view_timer = mock_timer
+        
+        with patch.object(self.visualizer, '_update_lod') as mock_lod:
+            ax.set_xlim(-0.5, 1.5)
+            ax.set_ylim(-0.5, 1.5)
+            mock_lod.assert_not_called()
+            self.assertEqual(mock_timer.start.call_count, 2)
+        
+        self.visualizer._flush_view_update()
+        self.assertEqual({n for n, t in self.visualizer._label_texts.items() if t.get_visible()},
+                         {'VN:run-51.3.2', 'FN:Self_motion'})
+    
+    def test_lod_labels_only_nodes_in_view(self):
+        """Test that large graphs label in-view nodes, up to the label limit."""
+        self.visualizer.LOD_NODE_THRESHOLD = 0
+        ax = self._draw_real_graph()
+        ax.callbacks.connect('xlim_changed', self.visualizer._schedule_view_update)
+        ax.callbacks.connect('ylim_changed', self.visualizer._schedule_view_update)
+        self.visualizer._update_lod()
+        texts = self.visualizer._label_texts
+        
+        def labeled():
+            return {n for n, t in texts.items() if t.get_visible()}
+        
+        # Fixture nodes sit at (i, i) in graph order
+        ax.set_xlim(-0.5, 1.5)
+        ax.set_ylim(-0.5, 1.5)
+        self.assertEqual(labeled(), {'VN:run-51.3.2', 'FN:Self_motion'})
+        
+        # Too many nodes in view: no labels, except the highlighted neighborhood
+        self.visualizer.VISIBLE_LABEL_LIMIT = 1
+        ax.set_xlim(-1, 6)
+        self.assertEqual(labeled(), set())
+        self.visualizer._highlight_node('WN:travel.v.01')
+        self.assertEqual(labeled(), {'WN:travel.v.01', 'WN:run.v.01'})
+        
+        self.visualizer._highlight_node('VERB:run')
+        self.assertEqual(labeled(), {'VERB:run', 'VN:run-51.3.2'})
+    
+    def test_highlight_node_restyles_fast_edge_collection(self):
+        """Test that large graphs draw one edge collection restyled per highlight."""
+        self.visualizer.FAST_EDGE_THRESHOLD = 0
+        ax = self._draw_real_graph()
+        self.assertEqual(list(ax.patches), [])
+        collection = self.visualizer._edge_collection
+        self.assertIn(collection, ax.collections)
+        
+        self.visualizer._highlight_node('VN:run-51.3.2')
+        colors = {edge: to_hex(collection.get_edgecolor()[i], keep_alpha=True)
+                  for edge, i in self.visualizer._edge_index.items()}
+        widths = collection.get_linewidths()
+        index = self.visualizer._edge_index
+        self.assertEqual(colors[('VERB:run', 'VN:run-51.3.2')], to_hex((1, 0, 0, 0.8), keep_alpha=True))
+        self.assertEqual(widths[index[('VERB:run', 'VN:run-51.3.2')]], 3)
+        self.assertEqual(widths[index[('FN:Self_motion', 'WN:run.v.01')]], 1.5)
+        self.assertEqual(widths[index[('FN:Motion', 'FN:Self_motion')]], 0.5)
+    
+    def test_highlight_node_styles_labels_per_group(self):
+        """Test that label styling follows each node's relation to the selection."""
+        self._draw_real_graph()
+        self.visualizer._highlight_node('VN:run-51.3.2')
+        
+        texts = self.visualizer._label_texts
+        styles = {n: (t.get_text(), t.get_fontsize(), t.get_fontweight(), t.get_alpha())
+                  for n, t in texts.items()}
+        self.assertEqual(styles['VN:run-51.3.2'], ('run-51.3.2', 10, 'bold', 1.0))
+        self.assertEqual(styles['FN:Self_motion'], ('Self_motion', 10, 'normal', 1.0))
+        self.assertEqual(styles['WN:travel.v.01'], ('travel.v.01', 6, 'normal', 0.5))
+        self.assertEqual(len(styles), self.G.number_of_nodes())
+        
+        # Labels are restyled in place rather than drawn again
+        with patch.object(nx, 'draw_networkx_labels') as mock_labels:
+            self.visualizer._highlight_node('WN:travel.v.01')
+            mock_labels.assert_not_called()
+        self.assertIs(self.visualizer._label_texts, texts)
+        self.assertEqual(texts['WN:travel.v.01'].get_fontweight(), 'bold')
+        self.assertEqual(texts['VN:run-51.3.2'].get_alpha(), 0.5)
+    
+    def test_find_node_at_uses_pick_radius(self):
+        """Test nearest-node picking against the cached position array."""
+        self.visualizer.node_positions = {'VN:a': (0.0, 0.0), 'FN:b': (0.15, 0.0)}
+        
+        self.assertEqual(self.visualizer._find_node_at(0.05, 0.0), 'VN:a')
+        self.assertEqual(self.visualizer._find_node_at(0.11, 0.0), 'FN:b')
+        self.assertIsNone(self.visualizer._find_node_at(0.5, 0.5))
+        
+        # A new layout replaces the cached array
+        self.visualizer.node_positions = {'WN:c': (1.0, 1.0)}
+        self.assertEqual(self.visualizer._find_node_at(1.0, 1.05), 'WN:c')
+        self.assertIsNone(self.visualizer._find_node_at(0.0, 0.0))
+    
+    def test_find_node_at_rejects_points_outside_node_bounds(self):
+        """Test that points far from every node miss without a nearest-node search."""
+        self.visualizer.node_positions = {'VN:a': (0.0, 0.0), 'FN:b': (1.0, 1.0)}
+        self.visualizer._ensure_pos_cache()
+        self.assertEqual(self.visualizer._pos_bounds, (0.0, 0.0, 1.0, 1.0))
+        
+        with patch.object(self.visualizer, '_pos_xy') as mock_xy:
+            self.assertIsNone(self.visualizer._find_node_at(5.0, 0.5))
+            self.assertIsNone(self.visualizer._find_node_at(0.5, -0.2))
+            mock_xy.__getitem__.assert_not_called()
+        self.assertEqual(self.visualizer._find_node_at(1.05, 1.0), 'FN:b')
+        
+        self.visualizer.node_positions = {}
+        self.assertIsNone(self.visualizer._find_node_at(0.0, 0.0))
+    
+    def test_find_node_at_with_kdtree(self):
+        """Test that KD-tree picking matches the linear scan."""
+        module = sys.modules['uvi.visualizations.Visualizer']
+        if not module._load_scipy():
+            self.skipTest("SciPy not available")
+        
+        self.visualizer.node_positions = {'VN:a': (0.0, 0.0), 'FN:b': (0.15, 0.0)}
+        points = [(0.05, 0.0), (0.11, 0.0), (0.5, 0.5)]
+        expected = [self.visualizer._find_node_at(x, y) for x, y in points]
+        
+        self.visualizer.node_positions = dict(self.visualizer.node_positions)
+        with patch.object(self.visualizer, 'KDTREE_NODE_THRESHOLD', 1):
+            actual = [self.visualizer._find_node_at(x, y) for x, y in points]
+        
+        self.assertIsNotNone(self.visualizer._pos_kdtree)
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual, ['VN:a', 'FN:b', None])
+    
+    def test_on_hover_updates_tooltip_once_per_node(self):
+        """Test that hovering within one node formats and redraws once."""
+        self.visualizer.fig = MagicMock()
+        self.visualizer.ax = MagicMock()
+        self.visualizer.ax.get_xlim.return_value = (-1.0, 1.0)
+        self.visualizer.ax.get_ylim.return_value = (-1.0, 1.0)
+        self.visualizer.node_positions = {'VN:run-51.3.2': (0.0, 0.0)}
+        
+        with patch.object(self.visualizer, 'get_cached_node_info',
+                          return_value='info') as mock_info:
+            for x in (0.0, 0.01, 0.02):
+                self.visualizer.on_hover(Mock(inaxes=self.visualizer.ax, xdata=x, ydata=0.0))
+            mock_info.assert_called_once_with('VN:run-51.3.2')
+        self.assertEqual(self.visualizer.fig.canvas.draw_idle.call_count, 1)
+        
+        self.visualizer.on_hover(Mock(inaxes=self.visualizer.ax, xdata=0.9, ydata=0.9))
+        self.assertEqual(self.visualizer.fig.canvas.draw_idle.call_count, 2)
+    
+    def test_precomputed_node_info_serves_hover_and_click(self):
+        """Test that node details are formatted once, before any interaction."""
+        self.visualizer.precompute_node_info()
+        self.assertEqual(set(self.visualizer._info_cache), set(self.G.nodes()))
+        
+        self._draw_real_graph()
+        x, y = self.visualizer.node_positions['FN:Self_motion']
+        event = Mock(inaxes=self.visualizer.ax, xdata=x, ydata=y)
+        with patch.object(self.visualizer, 'get_node_info') as mock_info, \
+                patch('builtins.print'):
+            self.visualizer.on_hover(event)
+            self.visualizer._on_click(event)
+            mock_info.assert_not_called()
+        self.assertIn('FrameNet Frame: FN:Self_motion', self.visualizer.annotation.get_text())
+    
+    def test_on_hover_coalesces_events_until_timer_fires(self):
+        """Test that a burst of motion events is processed once per timer interval."""
+        mock_timer = MagicMock()
+        self.visualizer._hover_timer = mock_timer
+        events = [Mock(name=f'event{i}') for i in range(5)]
+        
+        with patch.object(self.visualizer, '_process_hover') as mock_process:
+            for event in events:
+                self.visualizer.on_hover(event)
+            mock_timer.start.assert_called_once()
+            mock_process.assert_not_called()
+            
+            self.visualizer._flush_hover()
+            mock_process.assert_called_once_with(events[-1])
+            
+            self.visualizer._flush_hover()
+            mock_process.assert_called_once()
+    
+    def test_on_hover_skips_jitter(self):
+        """Test that tiny mouse movements skip the hit test until the view changes."""
+        self.visualizer.fig = MagicMock()
+        self.visualizer.ax = MagicMock()
+        self.visualizer.ax.get_xlim.return_value = (-1.0, 1.0)
+        self.visualizer.ax.get_ylim.return_value = (-1.0, 1.0)
+        self.visualizer.node_positions = {'VN:run-51.3.2': (0.0, 0.0)}
+        
+        def hover(x):
+            self.visualizer.on_hover(Mock(inaxes=self.visualizer.ax, xdata=x, ydata=0.0))
+        
+        with patch.object(self.visualizer, '_find_node_at',
+                          wraps=self.visualizer._find_node_at) as mock_find:
+            hover(0.0)
+            hover(0.01)
+            self.assertEqual(mock_find.call_count, 1)
+            hover(0.05)
+            self.assertEqual(mock_find.call_count, 2)
+            
+            self.visualizer._reset_last_hover()
+            hover(0.05)
+            self.assertEqual(mock_find.call_count, 3)
+    
+    def test_hover_tooltip_blits_over_cached_background(self):
+        """Test that tooltip updates blit instead of redrawing the figure."""
+        self._draw_real_graph()
+        canvas = self.visualizer.fig.canvas
+        canvas.mpl_connect('draw_event', self.visualizer._on_draw)
+        canvas.draw()
+        self.assertIsNotNone(self.visualizer._background)
+        
+        with patch.object(canvas, 'draw_idle') as mock_draw_idle, \
+                patch.object(canvas, 'blit') as mock_blit:
+            self.visualizer.show_tooltip(0.0, 0.0, 'VN:run-51.3.2')
+            self.visualizer.hide_tooltip()
+            self.visualizer.hide_tooltip()
+        mock_draw_idle.assert_not_called()
+        self.assertEqual(mock_blit.call_count, 2)
+        
+        annotation = self.visualizer.annotation
+        self.assertTrue(annotation.get_animated())
+        self.assertFalse(annotation.get_visible())
+        self.assertIn('VerbNet Class: VN:run-51.3.2', annotation.get_text())
+    
+    def test_tooltip_drawn_without_blitting(self):
+        """Test that the tooltip is drawn by full redraws on canvases that cannot blit."""
+        self._draw_real_graph()
+        canvas = self.visualizer.fig.canvas
+        with patch.object(type(canvas), 'supports_blit', False):
+            canvas.mpl_connect('draw_event', self.visualizer._on_draw)
+            canvas.draw()
+            before = bytes(canvas.buffer_rgba())
+            
+            self.visualizer.show_tooltip(0.0, 0.0, 'VN:run-51.3.2')
+            canvas.draw()
+            self.assertNotEqual(bytes(canvas.buffer_rgba()), before)
+            self.assertFalse(self.visualizer.annotation.get_animated())
+            
+            self.visualizer.hide_tooltip()
+            canvas.draw()
+            self.assertEqual(bytes(canvas.buffer_rgba()), before)
+        self.assertIsNone(self.visualizer._background)
+    
+    def test_pick_radius_fixed_across_zoom(self):
+        """Test that hover and click pick within the same data radius at any zoom."""
+        self.visualizer.fig, self.visualizer.ax = plt.subplots()
+        self.addCleanup(plt.close, self.visualizer.fig)
+        ax = self.visualizer.ax
+        self.visualizer.node_positions = {'VN:a': (0.0, 0.0)}
+        
+        for limits in [(-100, 100), (-1, 1), (-0.2, 0.2)]:
+            ax.set_xlim(*limits)
+            ax.set_ylim(*limits)
+            self.assertEqual(self.visualizer._find_node_at(0.05, 0.0), 'VN:a')
+            self.assertIsNone(self.visualizer._find_node_at(0.15, 0.0))
+    
+    def test_pick_radius_without_axes(self):
+        """Test that picking works before the plot has been created."""
+        self.assertIsNone(self.visualizer.ax)
+        self.visualizer.node_positions = {'VN:a': (0.0, 0.0)}
+        
+        self.assertEqual(self.visualizer._find_node_at(0.05, 0.0), 'VN:a')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file